@@ -14,6 +14,15 @@
 #
 """Collector Watcher - OpenTelemetry Collector component metadata automation."""
 
-import importlib.metadata
 
-__version__ = importlib.metadata.version("collector-watcher")
+def __getattr__(name: str) -> str:
+    """Resolve ``__version__`` on first access (PEP 562)."""
+    if name == "__version__":
+        # Imported here rather than at the top: importlib.metadata is slow to import and the
+        # version lookup scans installed distributions, a cost no sync or backfill run needs.
+        import importlib.metadata
+
+        version = importlib.metadata.version("collector-watcher")
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
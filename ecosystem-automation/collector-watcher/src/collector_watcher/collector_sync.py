@@ -15,6 +15,15 @@
 """Collector metadata synchronization to registry."""
 
 import logging
+import queue
+import shutil
+import tempfile
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
 from typing import Any
 
 from semantic_version import Version
@@ -31,6 +40,41 @@ logger = logging.getLogger(__name__)
 
 DistributionConfig = dict[DistributionName, str]
 
+#: Default number of linked worktrees (and scan threads) used by backfill_versions.
+DEFAULT_BACKFILL_WORKERS = 4
+
+# How many scans per worker backfill_versions may have queued or finished ahead of the save stage.
+_SCAN_LOOKAHEAD_PER_WORKER = 2
+
+# Upstream repositories whose names don't follow the opentelemetry-collector-{distribution} pattern.
+_REPO_NAMES: dict[DistributionName, str] = {
+    "core": "opentelemetry-collector",
+    "contrib": "opentelemetry-collector-contrib",
+}
+
+_SEP = "=" * 60
+
+
+@dataclass(slots=True)
+class _SyncEntry:
+    """A distribution version reported in the sync summary."""
+
+    distribution: DistributionName
+    version: str
+
+
+@dataclass(frozen=True, slots=True)
+class _CoreSchema:
+    """The core metadata schema recorded for a version: its content (None if absent) and hash."""
+
+    content: str | None
+    schema_hash: str
+
+
+def _banner(title: str) -> str:
+    """Format ``title`` as a separator-framed section header, emitted as a single log record."""
+    return f"\n{_SEP}\n{title}\n{_SEP}"
+
 
 class CollectorSync:
     """
@@ -47,6 +91,7 @@ class CollectorSync:
         self,
         repos: DistributionConfig,
         inventory_manager: InventoryManager,
+        force_snapshot: bool = False,
     ):
         """
         Initialize the collector sync.
@@ -55,19 +100,58 @@ class CollectorSync:
             repos: Dict mapping distribution name to local repo path
                    e.g., {"core": "/path/to/collector", "contrib": "/path/to/collector-contrib"}
             inventory_manager: InventoryManager instance for saving results
+            force_snapshot: Rescan main for every SNAPSHOT even when it hasn't moved since
+                the last sync (e.g. after a scanner change)
         """
         self.repos = repos
         self.inventory_manager = inventory_manager
+        self.force_snapshot = force_snapshot
         self.version_detectors = {dist: VersionDetector(path) for dist, path in repos.items()}
         self.schema_copier = CollectorSchemaCopier()
         self.deprecation_detector = DeprecationDetector()
         self.deprecations = inventory_manager.load_deprecations()
         self.previous_versions: dict[DistributionName, Version | None] = {}
         self.previous_components: dict[DistributionName, dict[str, list[dict[str, Any]]]] = {}
-        # Cache of core release tags for the lifetime of the sync run. get_all_release_tags()
-        # shells out to `git tag --list`, and _core_schema_refs() is called once per version;
-        # caching avoids an extra git process per saved version during a backfill.
-        self._core_release_tags: list[Version] | None = None
+        # sync() processes distributions concurrently. Scanning and checkout only touch each
+        # distribution's own clone, but registry writes share meta/schemas/, and snapshot cleanup
+        # prunes orphaned schemas there - so a cleanup racing another distribution's save could
+        # delete a schema whose referencing component YAMLs are not written yet.
+        self._inventory_lock = threading.Lock()
+        # Versions present in the registry per distribution. Loaded from disk on first use and kept
+        # current as this instance saves, deletes, and prunes versions, so repeated existence checks
+        # don't re-list the inventory directory. Call invalidate_cache() after external changes.
+        self._version_index: dict[DistributionName, set[Version]] = {}
+        # One scanner per distribution clone, created on first scan. The scanner holds only the
+        # repo path, so it stays valid across checkouts of that clone.
+        self._scanners: dict[DistributionName, ComponentScanner] = {}
+
+    def close(self) -> None:
+        """Release the git processes held by the distributions' version detectors."""
+        for detector in self.version_detectors.values():
+            detector.close()
+
+    def invalidate_cache(self, distribution: DistributionName | None = None) -> None:
+        """
+        Drop cached registry version listings and release tags so they are re-read.
+
+        Args:
+            distribution: Distribution to invalidate, or None for all distributions
+        """
+        if distribution is None:
+            self._version_index.clear()
+            for detector in self.version_detectors.values():
+                detector.invalidate_release_tags()
+        else:
+            self._version_index.pop(distribution, None)
+            self.version_detectors[distribution].invalidate_release_tags()
+
+    def _tracked_versions(self, distribution: DistributionName) -> set[Version]:
+        """Return the cached set of versions stored in the registry for ``distribution``."""
+        index = self._version_index.get(distribution)
+        if index is None:
+            index = set(self.inventory_manager.list_versions(distribution))
+            self._version_index[distribution] = index
+        return index
 
     @staticmethod
     def get_repository_name(distribution: DistributionName) -> str:
@@ -80,12 +164,7 @@ class CollectorSync:
         Returns:
             Repository name
         """
-        if distribution == "core":
-            return "opentelemetry-collector"
-        elif distribution == "contrib":
-            return "opentelemetry-collector-contrib"
-        else:
-            return f"opentelemetry-collector-{distribution}"
+        return _REPO_NAMES.get(distribution) or f"opentelemetry-collector-{distribution}"
 
     def scan_version(
         self,
@@ -104,18 +183,37 @@ class CollectorSync:
         Returns:
             Dictionary of component type to component list
         """
-        repo_path = self.repos[distribution]
-        detector = self.version_detectors[distribution]
+        scanner = self._scanners.get(distribution)
+        if scanner is None:
+            scanner = self._scanners[distribution] = ComponentScanner(self.repos[distribution])
+        return self._scan_checkout(
+            distribution,
+            version,
+            scanner,
+            self.version_detectors[distribution],
+            checkout=checkout,
+        )
 
-        if checkout and not version.prerelease:
-            logger.info("  Checking out %s %s...", distribution, version)
-            detector.checkout_version(version)
-        elif checkout and version.prerelease:
-            logger.info("  Checking out %s main branch...", distribution)
-            detector.checkout_main()
+    def _scan_checkout(
+        self,
+        distribution: DistributionName,
+        version: Version,
+        scanner: ComponentScanner,
+        detector: VersionDetector,
+        checkout: bool = True,
+        detach: bool = False,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Check out ``version`` with ``detector`` and scan that checkout (a clone or linked worktree)."""
+        if checkout:
+            # SNAPSHOTs have no tag; they are built from main.
+            if version.prerelease:
+                logger.info("  Checking out %s main branch...", distribution)
+                detector.checkout_main(detach=detach)
+            else:
+                logger.info("  Checking out %s %s...", distribution, version)
+                detector.checkout_version(version)
 
         logger.info("  Scanning %s %s...", distribution, version)
-        scanner = ComponentScanner(repo_path)
         components = scanner.scan_all_components()
 
         total = sum(len(comps) for comps in components.values())
@@ -166,6 +264,8 @@ class CollectorSync:
         distribution: DistributionName,
         version: Version,
         components: dict[str, list[dict[str, Any]]],
+        readmes: dict[str, str] | None = None,
+        source_commit: str | None = None,
     ) -> None:
         """
         Save scanned components for a specific version.
@@ -195,8 +295,30 @@ class CollectorSync:
             distribution: Distribution name
             version: Version being saved
             components: Scanned components
+            readmes: READMEs already discovered for ``components``, keyed by
+                component name. When None they are discovered from the
+                distribution's clone, which must be checked out at ``version``.
+            source_commit: Main-branch commit a SNAPSHOT was scanned from. When
+                given it is recorded so an unchanged main can skip the next rescan.
+        """
+        with self._inventory_lock:
+            self._save_version_locked(distribution, version, components, readmes, source_commit)
+
+    def _save_version_locked(
+        self,
+        distribution: DistributionName,
+        version: Version,
+        components: dict[str, list[dict[str, Any]]],
+        readmes: dict[str, str] | None = None,
+        source_commit: str | None = None,
+        core_schema: _CoreSchema | None = None,
+    ) -> None:
+        """Body of ``save_version``; callers must hold ``_inventory_lock``.
+
+        ``core_schema`` is the schema the caller already read for ``version``; it is
+        read from the core repo when None.
         """
-        schema_hash = self._resolve_schema_hash(version)
+        schema_hash = self._store_core_schema(core_schema or self._read_core_schema(version))
 
         repository = self.get_repository_name(distribution)
         self.inventory_manager.save_versioned_inventory(
@@ -206,6 +328,9 @@ class CollectorSync:
             repository=repository,
             schema_hash=schema_hash,
         )
+        self._tracked_versions(distribution).add(version)
+        if source_commit is not None:
+            self.inventory_manager.save_snapshot_source(distribution, version, source_commit, schema_hash)
 
         # Readme discovery/save runs after the critical inventory write, not
         # before: save_versioned_inventory() is what version_exists() treats
@@ -218,7 +343,8 @@ class CollectorSync:
         # written - causing process_latest_release() to skip it forever.
         repo_path = self.repos[distribution]
         try:
-            readmes = discover_component_readmes(repo_path, components)
+            if readmes is None:
+                readmes = discover_component_readmes(repo_path, components)
             written = self.inventory_manager.save_component_readmes(distribution, version, readmes.items())
             if written:
                 logger.info("  Saved %d component README(s)", written)
@@ -229,18 +355,17 @@ class CollectorSync:
 
         logger.info("  Saved %s %s (schema_hash=%s)", distribution, version, schema_hash)
 
-    def _resolve_schema_hash(self, version: Version) -> str:
-        """Store and return the core schema hash for ``version``.
+    def _read_core_schema(self, version: Version) -> _CoreSchema:
+        """Read and hash the core schema for ``version``, without storing it.
 
         ``mdatagen`` lives only in core, so every distribution records the core
         schema at its version. The schema is read from the core repo at that
         version's git ref, not the clone's current checkout — a backfill leaves
         the core clone on ``main``, which would otherwise stamp every version
         with the latest schema. Falls back through ``_core_schema_refs`` (with a
-        warning) and returns ``UNKNOWN_HASH`` if no ref yields the schema.
+        warning) and records ``UNKNOWN_HASH`` if no ref yields the schema.
         """
         core = self.version_detectors["core"]
-        schemas_dir = self.inventory_manager.meta_schemas_dir()
 
         candidate_refs = self._core_schema_refs(version)
         for index, ref in enumerate(candidate_refs):
@@ -254,8 +379,7 @@ class CollectorSync:
                     version,
                     ref,
                 )
-            stored = self.schema_copier.store_schema_content(content, schemas_dir)
-            return stored if stored is not None else UNKNOWN_HASH
+            return _CoreSchema(content, self.schema_copier.compute_schema_hash(content))
 
         logger.warning(
             "No core schema found for %s (tried: %s); recording %s",
@@ -263,7 +387,17 @@ class CollectorSync:
             ", ".join(candidate_refs),
             UNKNOWN_HASH,
         )
-        return UNKNOWN_HASH
+        return _CoreSchema(None, UNKNOWN_HASH)
+
+    def _store_core_schema(self, core_schema: _CoreSchema) -> str:
+        """Store ``core_schema`` in ``meta/schemas/`` (if it was found) and return its hash."""
+        if core_schema.content is not None:
+            self.schema_copier.store_schema_content(
+                core_schema.content,
+                self.inventory_manager.meta_schemas_dir(),
+                schema_hash=core_schema.schema_hash,
+            )
+        return core_schema.schema_hash
 
     def _core_schema_refs(self, version: Version) -> list[str]:
         """Ordered core refs to try for ``version``'s schema: exact tag, then the
@@ -273,11 +407,8 @@ class CollectorSync:
         if version.prerelease:
             return ["main"]
 
-        if self._core_release_tags is None:
-            self._core_release_tags = self.version_detectors["core"].get_all_release_tags()
-
         refs = [f"v{version}"]
-        earlier = [v for v in self._core_release_tags if not v.prerelease and v < version]
+        earlier = [v for v in self.version_detectors["core"].get_all_release_tags() if not v.prerelease and v < version]
         if earlier:
             refs.append(f"v{max(earlier)}")
         refs.append("main")
@@ -297,7 +428,7 @@ class CollectorSync:
         if distribution in self.previous_versions:
             return
 
-        existing_versions = self.inventory_manager.list_release_versions(distribution)
+        existing_versions = sorted((v for v in self._tracked_versions(distribution) if not v.prerelease), reverse=True)
         if existing_versions:
             latest = existing_versions[0]
             logger.debug("Initializing previous version for %s: %s", distribution, latest)
@@ -365,14 +496,12 @@ class CollectorSync:
         Returns:
             Latest version if processed, None if already exists or no releases
         """
-        detector = self.version_detectors[distribution]
-
-        latest = detector.get_latest_release_tag()
+        latest = self.version_detectors[distribution].get_latest_release_tag()
         if latest is None:
             logger.info("No releases found for %s", distribution)
             return None
 
-        if self.inventory_manager.version_exists(distribution, latest):
+        if latest in self._tracked_versions(distribution):
             logger.info("Version %s %s already tracked", distribution, latest)
             return None
 
@@ -392,19 +521,30 @@ class CollectorSync:
 
         This:
         1. Determines next snapshot version
-        2. Scans main branch
-        3. Cleans up old snapshots
-        4. Saves as new snapshot
+        2. Returns early if main hasn't moved since that snapshot was saved
+        3. Scans main branch
+        4. Cleans up old snapshots
+        5. Saves as new snapshot
 
         Args:
             distribution: Distribution name
 
         Returns:
-            Snapshot version that was created
+            Snapshot version that was created, or that was already current
         """
+        return self._update_snapshot(distribution)[0]
+
+    def _update_snapshot(self, distribution: DistributionName) -> tuple[Version, bool]:
+        """Run ``update_snapshot`` and also report whether the snapshot was rewritten (False if main hadn't moved)."""
         detector = self.version_detectors[distribution]
 
-        snapshot_version = detector.determine_next_snapshot_version()
+        snapshot_version = VersionDetector.next_snapshot_after(detector.get_latest_release_tag())
+        source_commit = detector.get_main_head_sha()
+        if not self.force_snapshot and self._snapshot_is_current(distribution, snapshot_version, source_commit):
+            logger.info("")
+            logger.info("Snapshot %s %s up to date (main at %s)", distribution, snapshot_version, source_commit)
+            return snapshot_version, False
+
         logger.info("")
         logger.info("Updating %s %s...", distribution, snapshot_version)
 
@@ -413,21 +553,59 @@ class CollectorSync:
 
         logger.info("")
         logger.info("Cleaning up old %s snapshots...", distribution)
-        removed = self.inventory_manager.cleanup_snapshots(distribution)
+        with self._inventory_lock:
+            removed = self.inventory_manager.cleanup_snapshots(distribution)
+            tracked = self._tracked_versions(distribution)
+            tracked.difference_update([v for v in tracked if v.prerelease])
         if removed > 0:
             logger.info("  Removed %d old snapshot(s)", removed)
 
-        self.save_version(distribution, snapshot_version, components)
+        self.save_version(distribution, snapshot_version, components, source_commit=source_commit)
         self.detect_and_track_deprecations(distribution, snapshot_version, components)
 
-        return snapshot_version
+        return snapshot_version, True
+
+    def _snapshot_is_current(
+        self,
+        distribution: DistributionName,
+        snapshot_version: Version,
+        source_commit: str | None,
+    ) -> bool:
+        """
+        Check whether the stored SNAPSHOT already reflects ``source_commit`` on main.
+
+        The snapshot is current only if it is the sole snapshot in the registry, was
+        recorded as scanned from ``source_commit``, and carries the schema hash of
+        core's main today - contrib snapshots take their schema from core, whose
+        main can move while contrib's doesn't.
+        """
+        if source_commit is None:
+            return False
+
+        snapshots = [v for v in self._tracked_versions(distribution) if v.prerelease]
+        if snapshots != [snapshot_version]:
+            return False
+
+        with self._inventory_lock:
+            recorded = self.inventory_manager.load_snapshot_source(distribution)
+        if (
+            not recorded
+            or recorded.get("version") != str(snapshot_version)
+            or recorded.get("source_commit") != source_commit
+        ):
+            return False
+
+        core_schema = self.version_detectors["core"].read_file_at_ref("main", SCHEMA_RELATIVE_PATH)
+        return recorded.get("schema_hash") == self.schema_copier.compute_schema_hash(core_schema)
+
+    def _process_distribution_sync(self, distribution: DistributionName) -> tuple[Version | None, Version, bool]:
+        logger.info("%s", _banner(f"Distribution: {distribution.upper()}"))
 
-    def _process_distribution_sync(self, distribution: DistributionName) -> tuple[Version | None, Version]:
         latest = self.process_latest_release(distribution)
 
-        snapshot = self.update_snapshot(distribution)
+        snapshot, snapshot_updated = self._update_snapshot(distribution)
 
-        return (latest, snapshot)
+        return (latest, snapshot, snapshot_updated)
 
     def sync(self) -> dict[str, Any]:
         """
@@ -438,56 +616,57 @@ class CollectorSync:
         2. Process any new releases
         3. Update snapshots for each distribution
 
+        Distributions are independent clones, so each one is processed on its
+        own worker thread; the checkout and scan work (git subprocesses and
+        filesystem walks) overlaps and wall-clock time tracks the slowest
+        distribution rather than the sum. Registry writes stay serialized via
+        ``_inventory_lock``. The summary is always reported in ``self.repos``
+        order, regardless of which distribution finishes first.
+
         Returns:
             Summary of what was processed
         """
-        summary = {
-            "new_releases": [],
-            "snapshots_updated": [],
-        }
-
-        logger.info("=" * 60)
-        logger.info("COLLECTOR METADATA SYNC")
-        logger.info("=" * 60)
-        distribution_results = {}
-        try:
-            for distribution in self.repos.keys():
-                logger.info("")
-                logger.info("=" * 60)
-                logger.info("Distribution: %s", distribution.upper())
-                logger.info("=" * 60)
-
-                latest, snapshot = self._process_distribution_sync(distribution)
-                distribution_results[distribution] = (latest, snapshot)
-
-        except Exception as e:
-            logger.error("Error processing distributions: %s", e)
-            raise
-
-        for distribution, (latest, snapshot) in distribution_results.items():
+        logger.info("%s", _banner("COLLECTOR METADATA SYNC"))
+        with ThreadPoolExecutor(max_workers=max(1, len(self.repos))) as executor:
+            futures = {
+                distribution: executor.submit(self._process_distribution_sync, distribution)
+                for distribution in self.repos.keys()
+            }
+            try:
+                distribution_results = {distribution: future.result() for distribution, future in futures.items()}
+            except Exception as e:
+                logger.error("Error processing distributions: %s", e)
+                raise
+
+        new_releases: list[_SyncEntry] = []
+        snapshots: list[_SyncEntry] = []
+        unchanged_snapshots: list[_SyncEntry] = []
+        for distribution, (latest, snapshot, snapshot_updated) in distribution_results.items():
             if latest:
-                summary["new_releases"].append({"distribution": distribution, "version": str(latest)})
-            summary["snapshots_updated"].append({"distribution": distribution, "version": str(snapshot)})
+                new_releases.append(_SyncEntry(distribution, str(latest)))
+            (snapshots if snapshot_updated else unchanged_snapshots).append(_SyncEntry(distribution, str(snapshot)))
 
-        logger.info("")
-        logger.info("=" * 60)
-        logger.info("SYNC COMPLETE")
-        logger.info("=" * 60)
-        logger.info("New releases processed: %d", len(summary["new_releases"]))
-        for item in summary["new_releases"]:
-            logger.info("  - %s: %s", item["distribution"], item["version"])
-        logger.info("Snapshots updated: %d", len(summary["snapshots_updated"]))
-        for item in summary["snapshots_updated"]:
-            logger.info("  - %s: %s", item["distribution"], item["version"])
+        report = [_banner("SYNC COMPLETE"), f"New releases processed: {len(new_releases)}"]
+        report.extend(f"  - {entry.distribution}: {entry.version}" for entry in new_releases)
+        report.append(f"Snapshots updated: {len(snapshots)}")
+        report.extend(f"  - {entry.distribution}: {entry.version}" for entry in snapshots)
+        report.append(f"Snapshots already current: {len(unchanged_snapshots)}")
+        report.extend(f"  - {entry.distribution}: {entry.version}" for entry in unchanged_snapshots)
+        logger.info("%s", "\n".join(report))
 
         self.inventory_manager.save_deprecations(self.deprecations)
 
-        return summary
+        return {
+            "new_releases": [asdict(entry) for entry in new_releases],
+            "snapshots_updated": [asdict(entry) for entry in snapshots],
+            "snapshots_unchanged": [asdict(entry) for entry in unchanged_snapshots],
+        }
 
     def backfill_versions(
         self,
         distribution: DistributionName,
         versions: list[Version] | None = None,
+        workers: int = DEFAULT_BACKFILL_WORKERS,
     ) -> dict[str, Any]:
         """
         Backfill (regenerate) specific versions for a distribution.
@@ -496,43 +675,53 @@ class CollectorSync:
         Useful when scanner logic changes (e.g., new exclusions) and you want to
         apply changes to historical versions.
 
+        Checkout and scanning run in parallel across up to ``workers`` linked
+        git worktrees (see ``_iter_scanned_versions``). Deletion, saving, and
+        deprecation tracking stay on the calling thread in ascending version
+        order, since each version's deprecations are computed against the one
+        before it.
+
         Args:
             distribution: Distribution name
             versions: List of versions to backfill, or None to backfill all existing versions
+            workers: Maximum number of versions to check out and scan concurrently
 
         Returns:
             Summary of versions that were backfilled
         """
         if versions is None:
-            versions = self.inventory_manager.list_versions(distribution)
+            versions = sorted(self._tracked_versions(distribution), reverse=True)
 
         if not versions:
             logger.info("No versions to backfill for %s", distribution)
             return {"distribution": distribution, "versions_processed": []}
 
-        logger.info("")
-        logger.info("=" * 60)
-        logger.info("BACKFILL MODE: %s", distribution.upper())
-        logger.info("=" * 60)
-        logger.info("Versions to backfill: %d", len(versions))
-        for v in versions:
-            logger.info("  - %s", v)
+        report = [_banner(f"BACKFILL MODE: {distribution.upper()}"), f"Versions to backfill: {len(versions)}"]
+        report.extend(f"  - {v}" for v in versions)
+        logger.info("%s", "\n".join(report))
 
         sorted_versions = sorted(versions)
         self.previous_versions[distribution] = None
         self.previous_components[distribution] = {}
 
         processed = []
-        for version in sorted_versions:
+        for version, components, readmes in self._iter_scanned_versions(distribution, sorted_versions, workers):
             logger.info("")
             logger.info("Backfilling %s %s...", distribution, version)
 
-            deleted = self.inventory_manager.delete_version(distribution, version)
-            if deleted:
-                logger.info("  Deleted existing data")
-
-            components = self.scan_version(distribution, version, checkout=True)
-            self.save_version(distribution, version, components)
+            # Read and hashed once: the unchanged check only compares the hash, and a rewrite
+            # stores the same schema after delete_version() has pruned orphaned ones.
+            core_schema = self._read_core_schema(version)
+            if self._is_saved_unchanged(distribution, version, components, readmes, core_schema.schema_hash):
+                logger.info("  Unchanged, keeping existing data")
+            else:
+                deleted = self.inventory_manager.delete_version(distribution, version)
+                self._tracked_versions(distribution).discard(version)
+                if deleted:
+                    logger.info("  Deleted existing data")
+
+                with self._inventory_lock:
+                    self._save_version_locked(distribution, version, components, readmes, core_schema=core_schema)
             self.detect_and_track_deprecations(distribution, version, components)
             processed.append(str(version))
 
@@ -544,6 +733,130 @@ class CollectorSync:
             "versions_processed": processed,
         }
 
+    def _is_saved_unchanged(
+        self,
+        distribution: DistributionName,
+        version: Version,
+        components: dict[str, list[dict[str, Any]]],
+        readmes: dict[str, str],
+        schema_hash: str,
+    ) -> bool:
+        """Return True if saving this scan would rewrite ``version`` with identical files.
+
+        Lets a backfill skip deleting and rewriting versions whose scan result
+        hasn't changed, so their files (and their modification times) are left alone.
+        """
+        with self._inventory_lock:
+            return self.inventory_manager.matches_saved_inventory(
+                distribution,
+                version,
+                components,
+                repository=self.get_repository_name(distribution),
+                schema_hash=schema_hash,
+                readmes=readmes.items(),
+            )
+
+    def _iter_scanned_versions(
+        self,
+        distribution: DistributionName,
+        versions: list[Version],
+        workers: int,
+    ) -> Iterator[tuple[Version, dict[str, list[dict[str, Any]]], dict[str, str]]]:
+        """
+        Yield ``(version, components, readmes)`` for each version, in the given order.
+
+        A single working tree can only be checked out at one tag at a time, so
+        parallel scans each get their own linked worktree (sharing the clone's
+        object store) in a temporary directory. Worker threads claim a free
+        worktree, check out and scan the version there, and read its READMEs
+        before handing the worktree back. Results are yielded in order as they
+        become available, so the caller's save of one version overlaps the
+        checkout and scan of the next ones; a bounded number of scans are
+        submitted ahead of the caller. With one worker (or one version) the distribution's
+        own clone is checked out and scanned directly.
+        """
+        workers = min(workers, len(versions))
+        if workers <= 1:
+            for version in versions:
+                components = self.scan_version(distribution, version, checkout=True)
+                readmes = self._discover_readmes(distribution, version, self.repos[distribution], components)
+                yield version, components, readmes
+            return
+
+        detector = self.version_detectors[distribution]
+        worktree_root = Path(tempfile.mkdtemp(prefix=f"collector-{distribution}-worktrees-"))
+        created: list[Path] = []
+        free_worktrees: queue.Queue[Path] = queue.Queue()
+        try:
+            for index in range(workers):
+                worktree = worktree_root / f"wt{index}"
+                detector.add_worktree(worktree)
+                created.append(worktree)
+                free_worktrees.put(worktree)
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                remaining = iter(versions)
+                pending: deque[tuple[Version, Future]] = deque()
+                try:
+                    while True:
+                        # Bounded look-ahead: scans run ahead of the consumer by at most
+                        # _SCAN_LOOKAHEAD_PER_WORKER * workers versions, so a slow save stage
+                        # applies backpressure instead of letting scanned inventories pile up.
+                        while len(pending) < _SCAN_LOOKAHEAD_PER_WORKER * workers:
+                            version = next(remaining, None)
+                            if version is None:
+                                break
+                            future = executor.submit(self._scan_in_worktree, distribution, version, free_worktrees)
+                            pending.append((version, future))
+                        if not pending:
+                            break
+                        version, future = pending.popleft()
+                        components, readmes = future.result()
+                        yield version, components, readmes
+                except BaseException:
+                    for _, future in pending:
+                        future.cancel()
+                    raise
+        finally:
+            for worktree in created:
+                detector.remove_worktree(worktree)
+            shutil.rmtree(worktree_root, ignore_errors=True)
+
+    def _scan_in_worktree(
+        self,
+        distribution: DistributionName,
+        version: Version,
+        free_worktrees: queue.Queue[Path],
+    ) -> tuple[dict[str, list[dict[str, Any]]], dict[str, str]]:
+        """Check out and scan ``version`` in a free worktree, returning components and READMEs."""
+        worktree = free_worktrees.get()
+        try:
+            components = self._scan_checkout(
+                distribution,
+                version,
+                ComponentScanner(str(worktree)),
+                VersionDetector(worktree),
+                checkout=True,
+                detach=True,
+            )
+            return components, self._discover_readmes(distribution, version, str(worktree), components)
+        finally:
+            free_worktrees.put(worktree)
+
+    @staticmethod
+    def _discover_readmes(
+        distribution: DistributionName,
+        version: Version,
+        repo_path: str,
+        components: dict[str, list[dict[str, Any]]],
+    ) -> dict[str, str]:
+        """Read the READMEs of ``components`` from a checkout of ``version``; best-effort."""
+        try:
+            return discover_component_readmes(repo_path, components)
+        except OSError as e:
+            logger.warning("  Failed to read component READMEs for %s %s: %s", distribution, version, e)
+            return {}
+
     def backfill(
         self,
         versions_by_dist: dict[DistributionName, list[Version] | None] | None = None,
@@ -568,9 +881,7 @@ class CollectorSync:
 
         summary = {"backfilled": []}
 
-        logger.info("=" * 60)
-        logger.info("BACKFILL MODE")
-        logger.info("=" * 60)
+        logger.info("%s", _banner("BACKFILL MODE"))
 
         for distribution in versions_by_dist.keys():
             keep = versions_by_dist[distribution]
@@ -580,19 +891,18 @@ class CollectorSync:
                 # would linger in deprecations.yaml (backfill_versions appends, never clears).
                 self.deprecations[distribution] = {component_type: [] for component_type in COMPONENT_TYPES}
                 removed = self.inventory_manager.prune_release_versions_not_in(distribution, keep)
+                self.invalidate_cache(distribution)
                 if removed:
                     logger.info("Pruned %d unlisted release version(s) from %s", removed, distribution)
             result = self.backfill_versions(distribution, keep)
             summary["backfilled"].append(result)
 
-        logger.info("")
-        logger.info("=" * 60)
-        logger.info("BACKFILL COMPLETE")
-        logger.info("=" * 60)
         total_versions = sum(len(item["versions_processed"]) for item in summary["backfilled"])
-        logger.info("Total versions backfilled: %d", total_versions)
-        for item in summary["backfilled"]:
-            logger.info("  %s: %d versions", item["distribution"], len(item["versions_processed"]))
+        report = [_banner("BACKFILL COMPLETE"), f"Total versions backfilled: {total_versions}"]
+        report.extend(
+            f"  {item['distribution']}: {len(item['versions_processed'])} versions" for item in summary["backfilled"]
+        )
+        logger.info("%s", "\n".join(report))
 
         self.inventory_manager.save_deprecations(self.deprecations)
 
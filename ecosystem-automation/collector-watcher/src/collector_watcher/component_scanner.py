@@ -18,6 +18,9 @@ This module scans collector repository directories to identify components
 and extract their metadata from metadata.yaml files.
 """
 
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -30,17 +33,26 @@ class ComponentScanner:
 
     # These directories are handled separately as nested component directories
     # or are utility packages that aren't actual components
-    EXCLUDED_DIRECTORIES = [
-        "extensionauth",  # Auth helpers for extensions
-        "extensioncapabilities",  # Capabilities framework
-        "extensionmiddleware",  # Middleware framework
-        "opampcustommessages",  # OpAMP utilities
-        "dbauth",  # Database auth interface
-    ]
-
-    EXCLUDED_COMPONENTS = [
-        "endpointswatcher",  # Utility component for watching endpoints, not a component
-    ]
+    EXCLUDED_DIRECTORIES: frozenset[str] = frozenset(
+        {
+            "extensionauth",  # Auth helpers for extensions
+            "extensioncapabilities",  # Capabilities framework
+            "extensionmiddleware",  # Middleware framework
+            "opampcustommessages",  # OpAMP utilities
+            "dbauth",  # Database auth interface
+        }
+    )
+
+    EXCLUDED_COMPONENTS: frozenset[str] = frozenset(
+        {
+            "endpointswatcher",  # Utility component for watching endpoints, not a component
+        }
+    )
+
+    # Name rules checked for every candidate directory, as single set/tuple tests
+    _EXCLUDED_NAMES: frozenset[str] = frozenset({"internal", "testdata"}) | EXCLUDED_COMPONENTS
+    _EXCLUDED_PREFIXES = (".", "_")
+    _EXCLUDED_SUFFIXES = ("test", "helper")
 
     # Directories that contain nested components (subtypes)
     NESTED_COMPONENT_DIRS = {"encoding", "observer", "storage"}
@@ -58,13 +70,26 @@ class ComponentScanner:
         """
         Scan all component types and return structured inventory.
 
+        The component type directories are independent, so they are scanned
+        concurrently; the result is the same as scanning them one after another.
+        Types without a directory in this checkout (e.g. ``connector`` in older
+        core versions) get an empty list without being handed to a worker.
+
         Returns:
             Dictionary mapping component types to lists of component info
         """
-        components = {}
-        for component_type in COMPONENT_TYPES:
-            components[component_type] = self.scan_component_type(component_type)
-        return components
+        present = [component_type for component_type in COMPONENT_TYPES if (self.repo_path / component_type).is_dir()]
+        if not present:
+            return {component_type: [] for component_type in COMPONENT_TYPES}
+
+        with ThreadPoolExecutor(max_workers=len(present)) as executor:
+            futures = {
+                component_type: executor.submit(self.scan_component_type, component_type) for component_type in present
+            }
+            return {
+                component_type: futures[component_type].result() if component_type in futures else []
+                for component_type in COMPONENT_TYPES
+            }
 
     def scan_component_type(self, component_type: str) -> list[dict[str, Any]]:
         """
@@ -76,66 +101,89 @@ class ComponentScanner:
         Returns:
             List of dictionaries containing component information
         """
-        component_dir = self.repo_path / component_type
-        if not component_dir.exists():
-            return []
+        return list(self._iter_component_type(component_type))
+
+    def _iter_component_type(self, component_type: str) -> Iterator[dict[str, Any]]:
+        """
+        Yield the components of one type in sorted directory order.
+
+        Args:
+            component_type: Type of component (receiver, processor, exporter etc.)
+
+        Yields:
+            Dictionaries containing component information
+        """
+        # Let the listing report a missing directory instead of stat'ing it first
+        try:
+            entries = self._list_subdirectories(self.repo_path / component_type)
+        except FileNotFoundError:
+            return
+
+        for entry, subtype in self._iter_component_entries(entries):
+            yield self._extract_component_info(entry.path, entry.name, component_type, subtype=subtype)
+
+    def _iter_component_entries(self, entries: list[os.DirEntry[str]]) -> Iterator[tuple[os.DirEntry[str], str | None]]:
+        """
+        Yield the directory entry of every component under a component type directory.
 
-        components = []
-        for item in sorted(component_dir.iterdir()):
-            if item.is_dir():
-                # Check if this is a nested component directory (e.g., extension/encoding)
-                if item.name in self.NESTED_COMPONENT_DIRS:
-                    nested_components = self._scan_nested_components(item, component_type, item.name)
-                    components.extend(nested_components)
-                elif self._is_component_directory(item):
-                    component_info = self._extract_component_info(item, component_type)
-                    components.append(component_info)
+        Nested component directories (e.g., extension/encoding) are descended into
+        inline, so regular and nested components come out of one traversal in
+        sorted directory order.
 
-        return components
+        Args:
+            entries: Sorted subdirectories of the component type directory
 
-    def _scan_nested_components(self, nested_dir: Path, component_type: str, subtype: str) -> list[dict[str, Any]]:
+        Yields:
+            Tuples of (component directory entry, subtype); subtype is the nested
+            directory's name (e.g., encoding, observer, storage) or None
+        """
+        for entry in entries:
+            if entry.name in self.NESTED_COMPONENT_DIRS:
+                for nested_entry in self._list_subdirectories(entry.path):
+                    if self._is_nested_component_directory(nested_entry):
+                        yield nested_entry, entry.name
+            elif self._is_component_directory(entry):
+                yield entry, None
+
+    @staticmethod
+    def _list_subdirectories(directory: str | Path) -> list[os.DirEntry[str]]:
         """
-        Scan a nested component directory (e.g., extension/encoding).
+        List the subdirectories of a directory, sorted by name.
+
+        Uses a single ``os.scandir`` pass: ``DirEntry.is_dir()`` is answered from
+        the directory listing itself (only symlinks need a stat), and callers get
+        the entry's name and path without building a ``Path`` per child.
 
         Args:
-            nested_dir: Path to the nested directory
-            component_type: Type of component (e.g., extension)
-            subtype: Subtype name (e.g., encoding, observer, storage)
+            directory: Directory to list
 
         Returns:
-            List of component dictionaries with subtype field set
+            Directory entries for each subdirectory
         """
-        components = []
-        for item in sorted(nested_dir.iterdir()):
-            if item.is_dir() and self._is_nested_component_directory(item):
-                component_info = self._extract_component_info(item, component_type, subtype=subtype)
-                components.append(component_info)
-        return components
+        with os.scandir(directory) as it:
+            entries = [entry for entry in it if entry.is_dir()]
+        entries.sort(key=lambda entry: entry.name)
+        return entries
 
-    def _is_valid_component_name(self, path: Path) -> bool:
+    def _is_valid_component_name(self, name: str) -> bool:
         """
         Check if a directory name is valid for a component.
 
         Excludes hidden, private, internal, test, and utility directories.
 
         Args:
-            path: Path to check
+            name: Directory name to check
 
         Returns:
             True if the directory name is valid
         """
-        if path.name.startswith(".") or path.name.startswith("_"):
-            return False
-        if path.name in ["internal", "testdata"]:
-            return False
-        if path.name.endswith("test") or path.name.endswith("helper"):
-            return False
-        for excluded in self.EXCLUDED_COMPONENTS:
-            if path.name == excluded:
-                return False
-        return True
+        return (
+            name not in self._EXCLUDED_NAMES
+            and not name.startswith(self._EXCLUDED_PREFIXES)
+            and not name.endswith(self._EXCLUDED_SUFFIXES)
+        )
 
-    def _has_go_code(self, path: Path) -> bool:
+    def _has_go_code(self, path: str | Path) -> bool:
         """
         Check if a directory contains Go code.
 
@@ -145,26 +193,28 @@ class ComponentScanner:
         Returns:
             True if directory has go.mod or .go files
         """
-        has_go_mod = (path / "go.mod").exists()
-        # Use next() to short-circuit and avoid scanning entire directory
-        has_go_files = next(path.glob("*.go"), None) is not None
-        return has_go_mod or has_go_files
-
-    def _is_nested_component_directory(self, path: Path) -> bool:
+        # One listing pass that stops at the first match, instead of a go.mod stat plus a glob
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.name == "go.mod" or entry.name.endswith(".go"):
+                    return True
+        return False
+
+    def _is_nested_component_directory(self, entry: os.DirEntry[str]) -> bool:
         """
         Check if a directory is a valid nested component.
 
         Similar to _is_component_directory but for nested components.
 
         Args:
-            path: Path to check
+            entry: Directory entry to check
 
         Returns:
             True if this appears to be a nested component directory
         """
-        return self._is_valid_component_name(path) and self._has_go_code(path)
+        return self._is_valid_component_name(entry.name) and self._has_go_code(entry.path)
 
-    def _is_component_directory(self, path: Path) -> bool:
+    def _is_component_directory(self, entry: os.DirEntry[str]) -> bool:
         """
         Check if a directory is a valid component.
 
@@ -172,54 +222,50 @@ class ComponentScanner:
         and excludes internal/test/utility directories.
 
         Args:
-            path: Path to check
+            entry: Directory entry to check
 
         Returns:
             True if this appears to be a component directory
         """
-        if not self._is_valid_component_name(path):
+        if not self._is_valid_component_name(entry.name):
             return False
 
-        if path.name in self.EXCLUDED_DIRECTORIES:
+        if entry.name in self.EXCLUDED_DIRECTORIES:
             return False
 
         # Nested component directories are handled separately
-        if path.name in self.NESTED_COMPONENT_DIRS:
+        if entry.name in self.NESTED_COMPONENT_DIRS:
             return False
 
-        return self._has_go_code(path)
+        return self._has_go_code(entry.path)
 
     def _extract_component_info(
-        self, component_path: Path, component_type: str, subtype: str | None = None
+        self, component_path: str, component_name: str, component_type: str, subtype: str | None = None
     ) -> dict[str, Any]:
         """
         Extract information about a component.
 
         Args:
-            component_path: Path to the component directory
+            component_path: Path to the component directory, as a string (e.g. ``DirEntry.path``)
+            component_name: Name of the component directory
             component_type: Type of component
             subtype: Optional subtype (e.g., "encoding", "observer", "storage")
 
         Returns:
             Dictionary with component information
         """
-        parser = MetadataParser(component_path)
-        has_metadata = parser.has_metadata()
-
         component_info = {
-            "name": component_path.name,
+            "name": component_name,
         }
 
         # Add subtype if this is a nested component
         if subtype:
             component_info["subtype"] = subtype
 
-        if has_metadata:
-            parsed_metadata = parser.parse()
-            if parsed_metadata:
-                component_info["metadata"] = parsed_metadata
-            else:
-                component_info["has_metadata"] = False
+        # parse() returns None both when metadata.yaml is absent and when it is empty or invalid
+        parsed_metadata = MetadataParser(component_path).parse()
+        if parsed_metadata:
+            component_info["metadata"] = parsed_metadata
         else:
             component_info["has_metadata"] = False
 
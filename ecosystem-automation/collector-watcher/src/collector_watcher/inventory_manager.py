@@ -14,12 +14,16 @@
 #
 """Inventory management for component tracking."""
 
+import copy
+import functools
+import io
 import logging
+import os
 import re
 import shutil
 from collections.abc import Iterable
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 import yaml
 from semantic_version import Version
@@ -27,13 +31,40 @@ from watcher_common.content_hashing import compute_content_hash
 
 from .type_defs import COMPONENT_TYPES, DistributionName
 
+# The libyaml-backed loader/dumper are several times faster than the pure-Python ones
+# and produce the same output; fall back when PyYAML was built without libyaml.
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
+# README files are stored as {name}-{12-hex-char hash}.md
+_README_FILENAME_RE = re.compile(r"^(.+)-([a-f0-9]{12})\.md$")
+
+# Write buffer for component YAML files: large enough that a whole file (contrib's largest,
+# receiver.yaml, is about 750 KB) reaches the OS in one write() on close, however many
+# per-component chunks _write_component_file emits.
+_COMPONENT_FILE_BUFFER_SIZE = 1 << 20
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_version_dir_name(name: str) -> Version | None:
+    """Parse a version directory name like ``v0.112.0``; None if it isn't a version."""
+    try:
+        return Version(name.lstrip("v"))
+    except ValueError:
+        return None
+
 
 class InventoryManager:
     """Manages component inventory storage and retrieval."""
 
     README_DIR = "component_readmes"
+    SNAPSHOT_SOURCES_FILE = "snapshot_sources.yaml"
 
     def __init__(self, inventory_dir: str = "ecosystem-registry/collector"):
         """
@@ -41,6 +72,10 @@ class InventoryManager:
             inventory_dir: Base directory for versioned metadata
         """
         self.inventory_dir = Path(inventory_dir)
+        # Parsed component YAMLs keyed by path, each stored with the (mtime_ns, size) it was
+        # parsed at. prune_orphan_schemas() re-reads every version's files after each deletion,
+        # so without this a backfill re-parses the same unchanged files once per version.
+        self._parsed_yaml: dict[Path, tuple[tuple[int, int], Any]] = {}
 
     def get_version_dir(self, distribution: DistributionName, version: Version) -> Path:
         """
@@ -94,8 +129,7 @@ class InventoryManager:
                         continue
                     for component_file in version_dir.glob("*.yaml"):
                         try:
-                            with open(component_file, encoding="utf-8") as f:
-                                data = yaml.safe_load(f) or {}
+                            data = self._load_component_file(component_file)
                         except yaml.YAMLError:
                             continue
                         schema_hash = data.get("schema_hash")
@@ -110,6 +144,61 @@ class InventoryManager:
 
         return removed
 
+    def load_snapshot_source(self, distribution: DistributionName) -> dict[str, str] | None:
+        """
+        Load what the current SNAPSHOT of a distribution was built from.
+
+        Args:
+            distribution: Distribution name
+
+        Returns:
+            Dict with ``version``, ``source_commit`` and ``schema_hash`` keys, or None if
+            nothing is recorded for the distribution
+        """
+        file_path = self.inventory_dir / "meta" / self.SNAPSHOT_SOURCES_FILE
+        if not file_path.exists():
+            return None
+
+        with open(file_path, encoding="utf-8") as f:
+            data = yaml.load(f, Loader=_YamlLoader) or {}
+
+        return data.get(distribution)
+
+    def save_snapshot_source(
+        self,
+        distribution: DistributionName,
+        version: Version,
+        source_commit: str,
+        schema_hash: str,
+    ) -> None:
+        """
+        Record the main-branch commit and schema a distribution's SNAPSHOT was built from.
+
+        Kept in a single file under ``meta/`` rather than in the component YAMLs, so a
+        moving main branch doesn't rewrite every snapshot file when no component changed.
+
+        Args:
+            distribution: Distribution name
+            version: SNAPSHOT version that was saved
+            source_commit: Commit SHA of the main branch that was scanned
+            schema_hash: Schema hash recorded on the snapshot's component YAMLs
+        """
+        file_path = self.inventory_dir / "meta" / self.SNAPSHOT_SOURCES_FILE
+        data: dict[str, dict[str, str]] = {}
+        if file_path.exists():
+            with open(file_path, encoding="utf-8") as f:
+                data = yaml.load(f, Loader=_YamlLoader) or {}
+
+        data[distribution] = {
+            "version": str(version),
+            "source_commit": source_commit,
+            "schema_hash": schema_hash,
+        }
+
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            yaml.dump(data, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=True)
+
     def save_versioned_inventory(
         self,
         distribution: DistributionName,
@@ -132,21 +221,146 @@ class InventoryManager:
         version_dir = self.get_version_dir(distribution, version)
         version_dir.mkdir(parents=True, exist_ok=True)
 
+        # The directory is created once above; each file is then a single open/write/close.
         for component_type in COMPONENT_TYPES:
-            component_list = components.get(component_type, [])
             file_path = version_dir / f"{component_type}.yaml"
+            with open(file_path, "w", encoding="utf-8", buffering=_COMPONENT_FILE_BUFFER_SIZE) as f:
+                self._write_component_file(
+                    f,
+                    distribution,
+                    version,
+                    component_type,
+                    components.get(component_type, []),
+                    repository,
+                    schema_hash,
+                )
+            self._parsed_yaml.pop(file_path, None)
 
-            component_data = {
-                "distribution": distribution,
-                "version": str(version),
-                "repository": repository,
-                "component_type": component_type,
-                "schema_hash": schema_hash,
-                "components": component_list,
-            }
+    def matches_saved_inventory(
+        self,
+        distribution: DistributionName,
+        version: Version,
+        components: dict[str, list[dict[str, Any]]],
+        repository: str,
+        schema_hash: str,
+        readmes: Iterable[tuple[str, str]],
+    ) -> bool:
+        """
+        Check whether saving this inventory would leave the version directory unchanged.
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                yaml.dump(component_data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        Compares the exact text ``save_versioned_inventory`` would write for every
+        component type, and the set of files ``save_component_readmes`` would leave
+        under ``component_readmes/``, against what is already on disk.
+
+        Args:
+            distribution: Distribution name (core or contrib)
+            version: Version object
+            components: Dictionary of component type to component list
+            repository: Name of the repository being scanned
+            schema_hash: Schema hash that would be recorded
+            readmes: (component_name, content) pairs that would be saved
+
+        Returns:
+            True if every file is already present with identical content and no
+            stale README files exist
+        """
+        version_dir = self.get_version_dir(distribution, version)
+        for component_type in COMPONENT_TYPES:
+            file_path = version_dir / f"{component_type}.yaml"
+            try:
+                existing = file_path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                return False
+            expected = io.StringIO()
+            self._write_component_file(
+                expected,
+                distribution,
+                version,
+                component_type,
+                components.get(component_type, []),
+                repository,
+                schema_hash,
+            )
+            if existing != expected.getvalue():
+                return False
+
+        readme_dir = version_dir / self.README_DIR
+        if not readme_dir.is_dir():
+            return False
+        expected_readmes = {
+            f"{self._sanitize_name(name)}-{compute_content_hash(content)}.md" for name, content in readmes
+        }
+        return set(os.listdir(readme_dir)) == expected_readmes
+
+    @staticmethod
+    def _write_component_file(
+        stream: TextIO,
+        distribution: DistributionName,
+        version: Version,
+        component_type: str,
+        component_list: list[dict[str, Any]],
+        repository: str,
+        schema_hash: str,
+    ) -> None:
+        """
+        Write one component type's YAML file to ``stream``.
+
+        The header is dumped first and then each component on its own, so only
+        one component's YAML representation is held in memory at a time instead
+        of the whole list's. The output is the same as dumping the complete
+        mapping in one call (block-style sequences under a top-level key are not
+        indented), except that a component repeated by reference is written out
+        in full rather than as a YAML alias.
+        """
+        dump_options = {"Dumper": _YamlDumper, "default_flow_style": False, "sort_keys": False, "allow_unicode": True}
+        header = {
+            "distribution": distribution,
+            "version": str(version),
+            "repository": repository,
+            "component_type": component_type,
+            "schema_hash": schema_hash,
+        }
+        if not component_list:
+            yaml.dump({**header, "components": []}, stream, **dump_options)
+            return
+
+        yaml.dump(header, stream, **dump_options)
+        stream.write("components:\n")
+        for component in component_list:
+            yaml.dump([component], stream, **dump_options)
+
+    def _load_component_file(self, file_path: Path) -> Any:
+        """
+        Parse a component YAML, reusing the previous parse if the file is unchanged.
+
+        A file is considered unchanged while its modification time and size match
+        the ones recorded when it was last parsed. The returned object is shared
+        with the cache and must not be mutated.
+
+        Args:
+            file_path: Path to a component YAML file
+
+        Returns:
+            Parsed YAML content ({} for an empty file)
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        stat = file_path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._parsed_yaml.get(file_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        with open(file_path, encoding="utf-8") as f:
+            data = yaml.load(f, Loader=_YamlLoader) or {}
+        self._parsed_yaml[file_path] = (key, data)
+        return data
+
+    def _forget_parsed(self, directory: Path) -> None:
+        """Drop cached parses of files under a directory that is being removed."""
+        for file_path in [path for path in self._parsed_yaml if path.is_relative_to(directory)]:
+            del self._parsed_yaml[file_path]
 
     def load_versioned_inventory(self, distribution: DistributionName, version: Version) -> dict[str, Any]:
         """
@@ -173,16 +387,19 @@ class InventoryManager:
         for component_type in COMPONENT_TYPES:
             file_path = version_dir / f"{component_type}.yaml"
 
-            if file_path.exists():
-                with open(file_path, encoding="utf-8") as f:
-                    data = yaml.safe_load(f) or {}
-                    components[component_type] = data.get("components", [])
-                    if not repository:
-                        repository = data.get("repository", "")
-                    if schema_hash == "unknown":
-                        schema_hash = data.get("schema_hash", "unknown")
-            else:
+            # The cache lookup stats the file anyway, so a missing file is detected there
+            try:
+                data = self._load_component_file(file_path)
+            except FileNotFoundError:
                 components[component_type] = []
+                continue
+
+            # Copy so callers can't mutate the cached parse
+            components[component_type] = copy.deepcopy(data.get("components", []))
+            if not repository:
+                repository = data.get("repository", "")
+            if schema_hash == "unknown":
+                schema_hash = data.get("schema_hash", "unknown")
 
         return {
             "distribution": distribution,
@@ -251,8 +468,11 @@ class InventoryManager:
         selected_readmes: dict[str, tuple[str, int, str]] = {}
         seen_hashes: dict[str, set[str]] = {}
 
-        for item in sorted(readme_dir.iterdir(), key=lambda p: p.name):
-            if item.is_file() and item.suffix == ".md":
+        with os.scandir(readme_dir) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+
+        for item in entries:
+            if item.is_file() and os.path.splitext(item.name)[1] == ".md":
                 parsed = self._parse_readme_filename(item.name)
                 if parsed:
                     component_name, markdown_hash = parsed
@@ -323,7 +543,7 @@ class InventoryManager:
         Parse a README filename into (component_name, markdown_hash).
         Format: {component-name}-{hash}.md
         """
-        match = re.match(r"^(.+)-([a-f0-9]{12})\.md$", filename)
+        match = _README_FILENAME_RE.match(filename)
         if match:
             return match.group(1), match.group(2)
         return None
@@ -339,18 +559,15 @@ class InventoryManager:
             List of versions, sorted newest to oldest
         """
         dist_dir = self.inventory_dir / distribution
-        if not dist_dir.exists():
-            return []
 
-        versions = []
-        for item in dist_dir.iterdir():
-            if item.is_dir():
-                try:
-                    version = Version(item.name.lstrip("v"))
-                    versions.append(version)
-                except ValueError:
-                    continue
+        # scandir answers is_dir() from the listing itself, where iterdir() needed a stat per entry
+        try:
+            with os.scandir(dist_dir) as it:
+                names = [entry.name for entry in it if entry.is_dir()]
+        except FileNotFoundError:
+            return []
 
+        versions = [version for version in map(_parse_version_dir_name, names) if version is not None]
         return sorted(versions, reverse=True)
 
     def list_snapshot_versions(self, distribution: DistributionName) -> list[Version]:
@@ -361,10 +578,25 @@ class InventoryManager:
             distribution: Distribution name
 
         Returns:
-            List of snapshot versions
+            List of snapshot versions, sorted newest to oldest
         """
-        all_versions = self.list_versions(distribution)
-        return [v for v in all_versions if v.prerelease]
+        dist_dir = self.inventory_dir / distribution
+
+        try:
+            with os.scandir(dist_dir) as it:
+                names = [entry.name for entry in it if self._is_prerelease_dir(entry.name) and entry.is_dir()]
+        except FileNotFoundError:
+            return []
+        return sorted((_parse_version_dir_name(name) for name in names), reverse=True)
+
+    @staticmethod
+    def _is_prerelease_dir(name: str) -> bool:
+        """Return True if a directory name is a prerelease (e.g. SNAPSHOT) version."""
+        # A semver prerelease always contains "-"; release names skip version parsing entirely.
+        if "-" not in name:
+            return False
+        version = _parse_version_dir_name(name)
+        return version is not None and bool(version.prerelease)
 
     def list_release_versions(self, distribution: DistributionName) -> list[Version]:
         """
@@ -389,14 +621,28 @@ class InventoryManager:
         Returns:
             Number of snapshot versions removed
         """
-        snapshots = self.list_snapshot_versions(distribution)
-        count = 0
+        dist_dir = self.inventory_dir / distribution
 
-        for snapshot in snapshots:
-            snapshot_dir = self.get_version_dir(distribution, snapshot)
-            if snapshot_dir.exists():
-                shutil.rmtree(snapshot_dir)
-                count += 1
+        # One listing pass finds the snapshot directories (a missing distribution directory means
+        # there are none); removal waits until the listing is closed. Only the canonical
+        # get_version_dir() name is removed: a stray "0.112.1-SNAPSHOT" or "vv0.1.0-SNAPSHOT" is left alone.
+        try:
+            with os.scandir(dist_dir) as it:
+                snapshot_dirs = [
+                    Path(entry.path)
+                    for entry in it
+                    if self._is_prerelease_dir(entry.name)
+                    and entry.name == f"v{_parse_version_dir_name(entry.name)}"
+                    and entry.is_dir()
+                ]
+        except FileNotFoundError:
+            return 0
+
+        count = 0
+        for snapshot_dir in snapshot_dirs:
+            shutil.rmtree(snapshot_dir)
+            self._forget_parsed(snapshot_dir)
+            count += 1
 
         if count > 0:
             self.prune_orphan_schemas()
@@ -425,10 +671,15 @@ class InventoryManager:
         for version in self.list_release_versions(distribution):
             if str(version) in keep:
                 continue
+            # Just listed, so remove without a separate existence check; a listed name that
+            # isn't the canonical "v{version}" (e.g. "0.112.0") is still skipped.
             version_dir = self.get_version_dir(distribution, version)
-            if version_dir.exists():
+            try:
                 shutil.rmtree(version_dir)
-                removed += 1
+            except FileNotFoundError:
+                continue
+            self._forget_parsed(version_dir)
+            removed += 1
 
         if removed > 0:
             self.prune_orphan_schemas()
@@ -463,6 +714,7 @@ class InventoryManager:
         version_dir = self.get_version_dir(distribution, version)
         if version_dir.exists():
             shutil.rmtree(version_dir)
+            self._forget_parsed(version_dir)
             self.prune_orphan_schemas()
             return True
         return False
@@ -485,7 +737,7 @@ class InventoryManager:
             }
 
         with open(deprecations_file, encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YamlLoader) or {}
 
         for dist in ["core", "contrib"]:
             if dist not in data:
@@ -507,7 +759,9 @@ class InventoryManager:
         self.inventory_dir.mkdir(parents=True, exist_ok=True)
 
         with open(deprecations_file, "w", encoding="utf-8") as f:
-            yaml.dump(deprecations, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+            yaml.dump(
+                deprecations, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False, allow_unicode=True
+            )
 
         logger.info(f"Saved deprecations index to {deprecations_file}")
 
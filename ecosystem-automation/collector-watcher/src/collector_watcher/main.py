@@ -18,12 +18,6 @@ import argparse
 import logging
 import sys
 
-from semantic_version import Version
-
-from collector_watcher.collector_sync import CollectorSync
-from collector_watcher.inventory_manager import InventoryManager
-from collector_watcher.repository_manager import RepositoryManager
-
 logger = logging.getLogger(__name__)
 
 
@@ -72,12 +66,25 @@ def main():
         help="Delete existing release versions NOT listed in --versions before backfilling "
         "(SNAPSHOT versions are always kept). Requires --backfill and --versions.",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rescan main for SNAPSHOT versions even when it has not moved since the last sync",
+    )
     args = parser.parse_args()
 
     if args.prune_unlisted and not (args.backfill and args.versions):
         logger.error("--prune-unlisted requires both --backfill and --versions")
         sys.exit(1)
 
+    # Imported only once the arguments are valid: these pull in semantic_version and the git,
+    # YAML and scanning stack, which --help and argument errors don't need.
+    from semantic_version import Version
+
+    from collector_watcher.collector_sync import CollectorSync
+    from collector_watcher.inventory_manager import InventoryManager
+    from collector_watcher.repository_manager import RepositoryManager
+
     logger.info("Collector Watcher")
     logger.info("Inventory directory: %s", args.inventory_dir)
 
@@ -115,32 +122,37 @@ def main():
         collector_sync = CollectorSync(
             repos=dist_config,
             inventory_manager=inventory_manager,
+            force_snapshot=args.force,
         )
 
-        if args.backfill:
-            versions_by_dist = None
-
-            if args.versions:
-                version_list = []
-                for v_str in args.versions.split(","):
-                    v_str = v_str.strip()
-                    try:
-                        version = Version(v_str)
-                        version_list.append(version)
-                    except ValueError:
-                        logger.error("Invalid version format: %s", v_str)
-                        sys.exit(1)
-
-                if args.distribution:
-                    versions_by_dist = {args.distribution: version_list}
-                else:
-                    versions_by_dist = {dist: version_list for dist in dist_config.keys()}
-            elif args.distribution:
-                versions_by_dist = {args.distribution: None}
-
-            collector_sync.backfill(versions_by_dist, prune_unlisted=args.prune_unlisted)
-        else:
-            collector_sync.sync()
+        # Stops the long-lived git cat-file processes even when the run fails
+        try:
+            if args.backfill:
+                versions_by_dist = None
+
+                if args.versions:
+                    version_list = []
+                    for v_str in args.versions.split(","):
+                        v_str = v_str.strip()
+                        try:
+                            version = Version(v_str)
+                            version_list.append(version)
+                        except ValueError:
+                            logger.error("Invalid version format: %s", v_str)
+                            sys.exit(1)
+
+                    if args.distribution:
+                        versions_by_dist = {args.distribution: version_list}
+                    else:
+                        versions_by_dist = {dist: version_list for dist in dist_config.keys()}
+                elif args.distribution:
+                    versions_by_dist = {args.distribution: None}
+
+                collector_sync.backfill(versions_by_dist, prune_unlisted=args.prune_unlisted)
+            else:
+                collector_sync.sync()
+        finally:
+            collector_sync.close()
 
     except Exception as e:
         logger.error("Error: %s", e, exc_info=True)
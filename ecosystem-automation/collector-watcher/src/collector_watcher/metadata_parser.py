@@ -34,14 +34,25 @@ Either kind of change that alters output requires re-extracting all
 historical registry versions via: uv run collector-watcher --backfill
 """
 
+import copy
+import functools
 import logging
-import re
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# libyaml's loader parses the same documents into the same objects, several times faster;
+# fall back when PyYAML was built without libyaml. Other YAML backends are deliberately not
+# used: they follow YAML 1.2 resolution (e.g. "on"/"yes" stay strings), which would change
+# the extracted metadata and with it every historical registry version.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
 
@@ -160,8 +171,8 @@ class MetadataParserV1(BaseMetadataParser):
         """Normalise multi-line YAML descriptions to a single clean string."""
         if not description:
             return description
-        cleaned = description.strip().replace("\n", " ")
-        return re.sub(r"\s+", " ", cleaned)
+        # split() with no separator drops leading/trailing whitespace and splits on runs of it
+        return " ".join(description.split())
 
     @staticmethod
     def _merge_known_fields(
@@ -187,14 +198,21 @@ class MetadataParserV1(BaseMetadataParser):
         The result is key-sorted at every depth via `_sorted_deep` (without
         reordering any sequences), so the same input always produces the same
         output regardless of the source YAML's field order, keeping the
-        content-addressed registry output deterministic.
+        content-addressed registry output deterministic. Values in
+        `normalized` must already be sorted that way (the normalizers build
+        them from `_merge_known_fields` and `_sorted_list`); only pass-through
+        values are sorted here, so nested objects aren't re-walked once per
+        enclosing level.
         """
-        merged = {**source, **normalized}
-        for key in list(merged):
-            path = f"{path_prefix}.{key}" if path_prefix else key
-            if path in exclude:
-                del merged[key]
-        return MetadataParserV1._sorted_deep(merged)
+        sorted_deep = MetadataParserV1._sorted_deep
+        merged = {key: sorted_deep(value) for key, value in source.items() if key not in normalized}
+        merged.update(normalized)
+        if exclude:
+            for key in list(merged):
+                path = f"{path_prefix}.{key}" if path_prefix else key
+                if path in exclude:
+                    del merged[key]
+        return dict(sorted(merged.items()))
 
     @staticmethod
     def _sorted_deep(value: Any) -> Any:
@@ -210,23 +228,25 @@ class MetadataParserV1(BaseMetadataParser):
             return [MetadataParserV1._sorted_deep(v) for v in value]
         return value
 
+    @staticmethod
+    def _sorted_list(value: Any) -> Any:
+        """Sort a list field's items (e.g. enum values); other values are only deep-sorted."""
+        return MetadataParserV1._sorted_deep(sorted(value) if isinstance(value, list) else value)
+
     def _parse_status(self, status: dict[str, Any]) -> dict[str, Any]:
         normalized: dict[str, Any] = {}
 
         if "stability" in status:
             stability: dict[str, Any] = {}
-            for level in sorted(status["stability"].keys()):
-                signals = status["stability"][level]
-                stability[level] = sorted(signals) if isinstance(signals, list) else signals
+            for level, signals in sorted(status["stability"].items()):
+                stability[level] = self._sorted_list(signals)
             normalized["stability"] = stability
 
         if "distributions" in status:
-            dists = status["distributions"]
-            normalized["distributions"] = sorted(dists) if isinstance(dists, list) else dists
+            normalized["distributions"] = self._sorted_list(status["distributions"])
 
         if "unsupported_platforms" in status:
-            platforms = status["unsupported_platforms"]
-            normalized["unsupported_platforms"] = sorted(platforms) if isinstance(platforms, list) else platforms
+            normalized["unsupported_platforms"] = self._sorted_list(status["unsupported_platforms"])
 
         return self._merge_known_fields(status, normalized, exclude=self.EXCLUDED_FIELDS, path_prefix="status")
 
@@ -235,17 +255,16 @@ class MetadataParserV1(BaseMetadataParser):
             return {}
 
         parsed: dict[str, Any] = {}
-        for attr_name in sorted(attributes.keys()):
-            attr = attributes[attr_name]
+        for attr_name, attr in sorted(attributes.items()):
             if isinstance(attr, dict):
                 normalized: dict[str, Any] = {}
                 if "description" in attr:
                     normalized["description"] = self._sanitize_description(attr["description"])
                 if "enum" in attr:
-                    normalized["enum"] = sorted(attr["enum"]) if isinstance(attr["enum"], list) else attr["enum"]
+                    normalized["enum"] = self._sorted_list(attr["enum"])
                 parsed[attr_name] = self._merge_known_fields(attr, normalized)
             else:
-                parsed[attr_name] = attr
+                parsed[attr_name] = self._sorted_deep(attr)
 
         return parsed
 
@@ -254,18 +273,16 @@ class MetadataParserV1(BaseMetadataParser):
             return {}
 
         parsed: dict[str, Any] = {}
-        for metric_name in sorted(metrics.keys()):
-            metric = metrics[metric_name]
+        for metric_name, metric in sorted(metrics.items()):
             if isinstance(metric, dict):
                 normalized: dict[str, Any] = {}
                 if "description" in metric:
                     normalized["description"] = self._sanitize_description(metric["description"])
                 if "attributes" in metric:
-                    attrs = metric["attributes"]
-                    normalized["attributes"] = sorted(attrs) if isinstance(attrs, list) else attrs
+                    normalized["attributes"] = self._sorted_list(metric["attributes"])
                 parsed[metric_name] = self._merge_known_fields(metric, normalized)
             else:
-                parsed[metric_name] = metric
+                parsed[metric_name] = self._sorted_deep(metric)
 
         return parsed
 
@@ -351,6 +368,30 @@ def parse_component_metadata(raw: dict[str, Any], schema_version: str | None = N
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=8192)
+def _parse_metadata_content(content: bytes, schema_version: str | None) -> dict[str, Any] | None:
+    """
+    Parse the bytes of a metadata.yaml file, memoized on the exact content.
+
+    A component's metadata.yaml is usually identical from one collector version
+    to the next, so a multi-version backfill would otherwise parse and normalize
+    the same content once per version (and once per worktree path). Exceptions
+    are not cached. The cached dict is shared, so ``MetadataParser`` hands every
+    caller its own ``copy.deepcopy`` of it.
+    """
+    raw = yaml.load(content, Loader=_YamlLoader)
+    if not raw:
+        return None
+
+    if schema_version is None:
+        # Auto-detect from the file itself. The upstream schema does not yet
+        # carry this field; the lookup is a no-op for now and will activate
+        # transparently once the upstream adds file_format or schema_version.
+        schema_version = raw.get("schema_version") or raw.get("file_format")
+
+    return parse_component_metadata(raw, schema_version)
+
+
 class MetadataParser:
     """File-I/O wrapper around the versioned parser infrastructure.
 
@@ -360,12 +401,13 @@ class MetadataParser:
     delegates to parse_component_metadata().
     """
 
-    def __init__(self, component_path: Path):
-        self.component_path = Path(component_path)
-        self.metadata_path = self.component_path / "metadata.yaml"
+    def __init__(self, component_path: str | Path):
+        # Plain string paths: the scanner builds one parser per component directory.
+        self.component_path = os.fspath(component_path)
+        self.metadata_path = os.path.join(self.component_path, "metadata.yaml")
 
     def has_metadata(self) -> bool:
-        return self.metadata_path.exists()
+        return os.path.exists(self.metadata_path)
 
     def parse(self, schema_version: str | None = None) -> dict[str, Any] | None:
         """
@@ -379,33 +421,48 @@ class MetadataParser:
         Returns:
             Normalised metadata dict, or None on failure.
         """
-        if not self.has_metadata():
-            return None
-
+        # One open (no separate existence check) and an unbuffered read: the whole file is
+        # wanted as bytes, so a BufferedReader would only add a copy.
         try:
-            with open(self.metadata_path, encoding="utf-8") as f:
-                raw = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            logger.warning("Failed to parse %s: %s", self.metadata_path, e)
+            with open(self.metadata_path, "rb", buffering=0) as f:
+                content = f.read()
+        except FileNotFoundError:
             return None
 
-        try:
-            if not raw:
-                return None
+        return self._parse_content(content, schema_version, self.metadata_path)
 
-            if schema_version is None:
-                # Auto-detect from the file itself. The upstream schema does not yet
-                # carry this field; the lookup is a no-op for now and will activate
-                # transparently once the upstream adds file_format or schema_version.
-                schema_version = raw.get("schema_version") or raw.get("file_format")
+    @staticmethod
+    def from_bytes(content: bytes, schema_version: str | None = None) -> dict[str, Any] | None:
+        """
+        Parse metadata.yaml content that is already in memory.
 
-            return parse_component_metadata(raw, schema_version)
+        Behaves exactly like ``parse`` once the file has been read.
+
+        Args:
+            content: Raw metadata.yaml content
+            schema_version: Override the parser version, as for ``parse``
 
+        Returns:
+            Normalised metadata dict, or None on failure.
+        """
+        return MetadataParser._parse_content(content, schema_version, "<bytes>")
+
+    @staticmethod
+    def _parse_content(content: bytes, schema_version: str | None, source: str) -> dict[str, Any] | None:
+        """Parse ``content``, logging failures against ``source`` (a path or placeholder)."""
+        try:
+            parsed = _parse_metadata_content(content, schema_version)
+        except yaml.YAMLError as e:
+            logger.warning("Failed to parse %s: %s", source, e)
+            return None
         except ValueError:
             # Propagate unsupported schema_version as a programming error, not a
             # data error.  The caller passed (or the file declared) a version string
             # that has no registered parser.
             raise
         except Exception as e:
-            logger.warning("Unexpected error parsing %s: %s", self.metadata_path, e)
+            logger.warning("Unexpected error parsing %s: %s", source, e)
             return None
+
+        # The cached dict is shared between callers; each one gets its own copy
+        return None if parsed is None else copy.deepcopy(parsed)
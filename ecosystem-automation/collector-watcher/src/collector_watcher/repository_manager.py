@@ -19,6 +19,7 @@ environment variables or default locations.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -94,14 +95,19 @@ class RepositoryManager(BaseRepositoryManager):
 
         if not repo_path.exists():
             logger.info("Cloning %s repository to %s", distribution, repo_path)
-            self._clone_repository(REPO_URLS[distribution], repo_path)
-        elif update and version is None:
+            # Cloning straight at the tag checks out only that tree, with no separate checkout.
+            # The collector repositories are large, so only the checked-out trees' blobs are fetched.
+            tag = f"v{version}" if version else None
+            self._clone_repository(REPO_URLS[distribution], repo_path, branch=tag, blobless=True)
+            if tag:
+                # Snapshot runs read and resolve the local main branch, which a tag clone lacks
+                self._create_local_branch(repo_path)
+        elif version:
+            self._checkout_version(repo_path, version)
+        elif update:
             logger.info("Updating %s repository at %s", distribution, repo_path)
             self._pull_latest(repo_path)
 
-        if version:
-            self._checkout_version(repo_path, version)
-
         return repo_path
 
     def setup_all_repositories(
@@ -112,6 +118,9 @@ class RepositoryManager(BaseRepositoryManager):
         """
         Set up all collector repositories.
 
+        The repositories are independent clones, so they are cloned or updated
+        concurrently; contrib's clone/fetch dominates, and core's overlaps with it.
+
         Args:
             version: Optional version to checkout for all repos
             update: Whether to pull latest changes for existing repos
@@ -119,7 +128,10 @@ class RepositoryManager(BaseRepositoryManager):
         Returns:
             Dictionary mapping distribution names to repository paths
         """
-        return {
-            "core": self.setup_repository("core", version, update),
-            "contrib": self.setup_repository("contrib", version, update),
-        }
+        distributions: list[DistributionName] = ["core", "contrib"]
+        with ThreadPoolExecutor(max_workers=len(distributions)) as executor:
+            futures = {
+                distribution: executor.submit(self.setup_repository, distribution, version, update)
+                for distribution in distributions
+            }
+            return {distribution: future.result() for distribution, future in futures.items()}
@@ -27,6 +27,13 @@ from pathlib import Path
 import yaml
 from watcher_common.content_hashing import compute_content_hash
 
+# Only the parse uses libyaml when available; the canonical dump below stays on safe_dump,
+# so hashes don't depend on which loader was used.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
 SCHEMA_RELATIVE_PATH = "cmd/mdatagen/metadata-schema.yaml"
@@ -38,7 +45,7 @@ class CollectorSchemaCopier:
     """Stores metadata-schema.yaml content into content-addressable storage.
 
     The hash is computed from the *normalized* YAML representation of the schema
-    (``yaml.safe_load`` then ``yaml.safe_dump`` with stable options), so
+    (a safe load, then ``yaml.safe_dump`` with stable options), so
     comment-only, formatting, and key-order changes upstream do not churn the
     store. The stored file keeps the original content verbatim — only the file
     *name* is derived from the normalized hash.
@@ -49,7 +56,12 @@ class CollectorSchemaCopier:
     clone happens to be checked out to.
     """
 
-    def store_schema_content(self, content: str | None, schemas_dir: Path) -> str | None:
+    def store_schema_content(
+        self,
+        content: str | None,
+        schemas_dir: Path,
+        schema_hash: str | None = None,
+    ) -> str | None:
         """
         Store schema content into a hash-named file under ``schemas_dir``.
 
@@ -63,6 +75,8 @@ class CollectorSchemaCopier:
                 file is absent at the requested ref (older tags pre-date it).
             schemas_dir: Content-addressable storage directory (typically
                 ``ecosystem-registry/collector/meta/schemas``).
+            schema_hash: ``compute_schema_hash(content)``, when the caller already
+                has it; computed here otherwise.
 
         Returns:
             The 12-char schema hash on success, or None when ``content`` is None.
@@ -70,7 +84,8 @@ class CollectorSchemaCopier:
         if content is None:
             return None
 
-        schema_hash = self.compute_schema_hash(content)
+        if schema_hash is None:
+            schema_hash = self.compute_schema_hash(content)
         dst = schemas_dir / f"{schema_hash}.yaml"
         if dst.exists():
             logger.debug("Schema %s already stored at %s, skipping write", schema_hash, dst)
@@ -110,7 +125,7 @@ class CollectorSchemaCopier:
         upgrades. Changing these options re-hashes every schema and requires a
         full backfill to keep the store deduplicated.
         """
-        data = yaml.safe_load(content)
+        data = yaml.load(content, Loader=_YamlLoader)
         return yaml.safe_dump(
             data,
             sort_keys=True,
@@ -15,18 +15,20 @@
 """Tests for collector sync."""
 
 import logging
+import os
 import shutil
-import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from subprocess import CalledProcessError
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
 import yaml
-from collector_watcher.collector_sync import CollectorSync
+from collector_watcher.collector_sync import _SCAN_LOOKAHEAD_PER_WORKER, CollectorSync
 from collector_watcher.inventory_manager import InventoryManager
 from semantic_version import Version
-from watcher_common.testing import init_repo, run_git
+from watcher_common.testing import git_commit, import_tagged_history, init_repo, run_git
 
 
 def set_core_schema(repo_path, content, tag=None):
@@ -48,51 +50,52 @@ def set_core_schema(repo_path, content, tag=None):
 
 
 @pytest.fixture
-def temp_inventory_dir():
+def temp_inventory_dir(tmp_path):
     """Create a temporary inventory directory."""
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir)
+    inventory_dir = tmp_path / "inventory"
+    inventory_dir.mkdir()
+    return inventory_dir
+
+
+@pytest.fixture(scope="session")
+def git_repo_templates(tmp_path_factory):
+    """Build the core and contrib repos once per session; tests get copies via temp_git_repos."""
+    templates_dir = tmp_path_factory.mktemp("repo-templates")
+
+    core_path = templates_dir / "core"
+    core_path.mkdir()
+    init_repo(core_path)
+    import_tagged_history(
+        core_path,
+        [
+            ("v0.110.0", "initial content", "Initial commit"),
+            ("v0.111.0", "update 1", "Update 1"),
+            ("v0.112.0", "update 2", "Update 2"),
+        ],
+    )
+    # contrib starts out with the same history as core
+    shutil.copytree(core_path, templates_dir / "contrib")
+
+    return templates_dir
 
 
 @pytest.fixture
-def temp_git_repos(tmp_path):
+def temp_git_repos(git_repo_templates, tmp_path):
+    # Tests commit, tag and check out in these repos, so each test works on its own copy
     repos = {}
-
     for dist in ["core", "contrib"]:
         repo_path = tmp_path / dist
-        repo_path.mkdir()
-        init_repo(repo_path)
-
-        test_file = repo_path / "test.txt"
-        test_file.write_text("initial content")
-        run_git(repo_path, "add", "test.txt")
-        run_git(repo_path, "commit", "-m", "Initial commit")
-
-        try:
-            run_git(repo_path, "checkout", "-b", "main")
-        except CalledProcessError:
-            run_git(repo_path, "checkout", "main")
-
-        run_git(repo_path, "tag", "v0.110.0")
-
-        test_file.write_text("update 1")
-        run_git(repo_path, "add", "test.txt")
-        run_git(repo_path, "commit", "-m", "Update 1")
-        run_git(repo_path, "tag", "v0.111.0")
-
-        test_file.write_text("update 2")
-        run_git(repo_path, "add", "test.txt")
-        run_git(repo_path, "commit", "-m", "Update 2")
-        run_git(repo_path, "tag", "v0.112.0")
-
+        shutil.copytree(git_repo_templates / dist, repo_path)
         repos[dist] = str(repo_path)
-
     return repos
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_components():
+    """Scanner output shared by every test in the session; CollectorSync only reads it.
+
+    Kept as plain dicts and lists because it is dumped to YAML as-is.
+    """
     return {
         "connector": [],
         "exporter": [
@@ -108,31 +111,67 @@ def sample_components():
     }
 
 
+class _FakeScanner:
+    """Stand-in for ComponentScanner whose scans all return ``components``."""
+
+    components: dict[str, list[dict[str, Any]]] = {}
+
+    def __init__(self, repo_path):
+        self.repo_path = repo_path
+
+    def scan_all_components(self):
+        return self.components
+
+
+@pytest.fixture
+def stub_scanner(monkeypatch, sample_components):
+    """Replace CollectorSync's ComponentScanner with a plain fake whose scans return sample_components."""
+    monkeypatch.setattr(_FakeScanner, "components", sample_components)
+    monkeypatch.setattr("collector_watcher.collector_sync.ComponentScanner", _FakeScanner)
+
+
+@pytest.fixture
+def patched_scanner(monkeypatch, sample_components):
+    """Like stub_scanner, but a Mock for tests that assert how the scanner was called."""
+    fake_scanner = Mock()
+    fake_scanner.return_value.scan_all_components.return_value = sample_components
+    monkeypatch.setattr("collector_watcher.collector_sync.ComponentScanner", fake_scanner)
+    return fake_scanner
+
+
 @pytest.fixture
 def collector_sync(temp_git_repos, temp_inventory_dir):
     inventory_manager = InventoryManager(str(temp_inventory_dir))
-    return CollectorSync(
+    sync = CollectorSync(
         repos=temp_git_repos,
         inventory_manager=inventory_manager,
     )
+    yield sync
+    # Stop the detectors' cat-file processes now rather than whenever the instance is collected
+    sync.close()
 
 
 def test_get_repository_name(collector_sync):
     assert collector_sync.get_repository_name("core") == "opentelemetry-collector"
     assert collector_sync.get_repository_name("contrib") == "opentelemetry-collector-contrib"
+    assert CollectorSync.get_repository_name("k8s") == "opentelemetry-collector-k8s"
+
+
+def test_scan_version_without_checkout(collector_sync, sample_components, patched_scanner):
+    version = Version("0.112.0")
+    result = collector_sync.scan_version("core", version, checkout=False)
 
+    assert result == sample_components
+    patched_scanner.assert_called_once()
 
-def test_scan_version_without_checkout(collector_sync, sample_components):
-    with patch("collector_watcher.collector_sync.ComponentScanner") as mock_scanner:
-        mock_instance = Mock()
-        mock_instance.scan_all_components.return_value = sample_components
-        mock_scanner.return_value = mock_instance
 
-        version = Version("0.112.0")
-        result = collector_sync.scan_version("core", version, checkout=False)
+def test_scan_version_reuses_scanner_per_distribution(collector_sync, sample_components, patched_scanner):
+    collector_sync.scan_version("core", Version("0.111.0"), checkout=False)
+    collector_sync.scan_version("core", Version("0.112.0"), checkout=False)
+    collector_sync.scan_version("contrib", Version("0.112.0"), checkout=False)
 
-        assert result == sample_components
-        mock_scanner.assert_called_once()
+    assert patched_scanner.call_count == 2
+    assert patched_scanner.return_value.scan_all_components.call_count == 3
 
 
 def test_save_version(collector_sync, sample_components, temp_inventory_dir):
@@ -140,10 +179,7 @@ def test_save_version(collector_sync, sample_components, temp_inventory_dir):
     collector_sync.save_version("core", version, sample_components)
 
     version_dir = temp_inventory_dir / "core" / "v0.112.0"
-    assert version_dir.exists()
-    assert (version_dir / "receiver.yaml").exists()
-    assert (version_dir / "processor.yaml").exists()
-    assert (version_dir / "exporter.yaml").exists()
+    assert {"receiver.yaml", "processor.yaml", "exporter.yaml"} <= set(os.listdir(version_dir))
 
 
 def test_save_version_writes_schema_hash_unknown_when_schema_absent(
@@ -338,128 +374,177 @@ def test_process_latest_release_already_exists(collector_sync, sample_components
     assert result is None
 
 
-def test_process_latest_release_new_version(collector_sync, sample_components):
-    with patch("collector_watcher.collector_sync.ComponentScanner") as mock_scanner:
-        mock_instance = Mock()
-        mock_instance.scan_all_components.return_value = sample_components
-        mock_scanner.return_value = mock_instance
-
-        result = collector_sync.process_latest_release("core")
+def test_process_latest_release_uses_cached_version_index(collector_sync, sample_components):
+    collector_sync.save_version("core", Version("0.112.0"), sample_components)
 
-        # Should return the version that was processed
-        assert result is not None
-        assert str(result) == "0.112.0"
+    with patch.object(collector_sync.inventory_manager, "list_versions") as mock_list:
+        assert collector_sync.process_latest_release("core") is None
 
+    mock_list.assert_not_called()
 
-def test_update_snapshot_version(collector_sync, sample_components, temp_inventory_dir):
-    with patch("collector_watcher.collector_sync.ComponentScanner") as mock_scanner:
-        mock_instance = Mock()
-        mock_instance.scan_all_components.return_value = sample_components
-        mock_scanner.return_value = mock_instance
 
-        # Create an old snapshot
-        old_snapshot = Version(major=0, minor=111, patch=0, prerelease=("SNAPSHOT",))
-        collector_sync.save_version("core", old_snapshot, sample_components)
-        assert collector_sync.inventory_manager.version_exists("core", old_snapshot)
+def test_invalidate_cache_picks_up_external_changes(collector_sync, sample_components):
+    version = Version("0.112.0")
+    collector_sync.save_version("core", version, sample_components)
+    collector_sync.inventory_manager.delete_version("core", version)
 
-        # Update snapshot
-        result = collector_sync.update_snapshot("core")
+    assert version in collector_sync._tracked_versions("core")
+    collector_sync.invalidate_cache("core")
+    assert version not in collector_sync._tracked_versions("core")
 
-        # Old snapshot should be removed
-        assert not collector_sync.inventory_manager.version_exists("core", old_snapshot)
 
-        # New snapshot should exist
-        assert result.prerelease
-        assert collector_sync.inventory_manager.version_exists("core", result)
+def test_process_latest_release_new_version(collector_sync, sample_components, stub_scanner):
+    result = collector_sync.process_latest_release("core")
 
+    # Should return the version that was processed
+    assert result is not None
+    assert str(result) == "0.112.0"
 
-def test_cleanup_multiple_snapshots(collector_sync, sample_components):
-    snapshots = [
-        Version(major=0, minor=110, patch=0, prerelease=("SNAPSHOT",)),
-        Version(major=0, minor=111, patch=0, prerelease=("SNAPSHOT",)),
-        Version(major=0, minor=112, patch=0, prerelease=("SNAPSHOT",)),
-    ]
 
-    for snapshot in snapshots:
+@pytest.mark.parametrize("old_minors", [(111,), (110, 111, 112)])
+def test_update_snapshot_replaces_old_snapshots(collector_sync, sample_components, stub_scanner, old_minors):
+    old_snapshots = [Version(major=0, minor=minor, patch=0, prerelease=("SNAPSHOT",)) for minor in old_minors]
+    for snapshot in old_snapshots:
         collector_sync.save_version("core", snapshot, sample_components)
-
-    for snapshot in snapshots:
         assert collector_sync.inventory_manager.version_exists("core", snapshot)
 
-    with patch("collector_watcher.collector_sync.ComponentScanner") as mock_scanner:
-        mock_instance = Mock()
-        mock_instance.scan_all_components.return_value = sample_components
-        mock_scanner.return_value = mock_instance
+    result = collector_sync.update_snapshot("core")
 
-        collector_sync.update_snapshot("core")
-
-    for snapshot in snapshots:
+    # Old snapshots should be removed
+    for snapshot in old_snapshots:
         assert not collector_sync.inventory_manager.version_exists("core", snapshot)
 
+    # New snapshot should exist
+    assert result.prerelease
+    assert collector_sync.inventory_manager.version_exists("core", result)
 
-def test_complete_sync_workflow(collector_sync, sample_components):
-    with patch("collector_watcher.collector_sync.ComponentScanner") as mock_scanner:
-        mock_instance = Mock()
-        mock_instance.scan_all_components.return_value = sample_components
-        mock_scanner.return_value = mock_instance
 
-        result = collector_sync.sync()
+def test_release_tags_listed_once_per_distribution(collector_sync, stub_scanner):
+    core_detector = collector_sync.version_detectors["core"]
+    with patch.object(core_detector, "_list_tags", wraps=core_detector._list_tags) as mock_tags:
+        latest = collector_sync.process_latest_release("core")
+        snapshot = collector_sync.update_snapshot("core")
+
+    assert latest == Version("0.112.0")
+    assert snapshot == Version("0.112.1-SNAPSHOT")
+    mock_tags.assert_called_once()
+
 
-        assert len(result["new_releases"]) == 2
-        assert len(result["snapshots_updated"]) == 2
+def test_update_snapshot_skips_rescan_when_main_unchanged(collector_sync, sample_components, patched_scanner):
+    first = collector_sync.update_snapshot("core")
+    second = collector_sync.update_snapshot("core")
 
-        release_dists = [item["distribution"] for item in result["new_releases"]]
-        assert "core" in release_dists
-        assert "contrib" in release_dists
+    assert second == first
+    assert patched_scanner.return_value.scan_all_components.call_count == 1
+    assert collector_sync.inventory_manager.version_exists("core", first)
+
+
+def test_update_snapshot_rescans_when_main_moves(collector_sync, sample_components, temp_git_repos, patched_scanner):
+    collector_sync.update_snapshot("core")
+    repo_path = Path(temp_git_repos["core"])
+    (repo_path / "new_file.txt").write_text("new commit on main")
+    run_git(repo_path, "add", "new_file.txt")
+    git_commit(repo_path, "Advance main")
+    collector_sync.update_snapshot("core")
 
-        snapshot_dists = [item["distribution"] for item in result["snapshots_updated"]]
-        assert "core" in snapshot_dists
-        assert "contrib" in snapshot_dists
+    assert patched_scanner.return_value.scan_all_components.call_count == 2
+    recorded = collector_sync.inventory_manager.load_snapshot_source("core")
+    assert recorded["source_commit"] == run_git(repo_path, "rev-parse", "main")
 
 
-def test_sync_no_new_releases(collector_sync, sample_components):
-    with patch("collector_watcher.collector_sync.ComponentScanner") as mock_scanner:
-        mock_instance = Mock()
-        mock_instance.scan_all_components.return_value = sample_components
-        mock_scanner.return_value = mock_instance
+def test_update_snapshot_force_rescans_unchanged_main(collector_sync, sample_components, patched_scanner):
+    collector_sync.force_snapshot = True
+    collector_sync.update_snapshot("core")
+    collector_sync.update_snapshot("core")
 
+    assert patched_scanner.return_value.scan_all_components.call_count == 2
+
+
+def test_complete_sync_workflow(collector_sync, sample_components, stub_scanner):
+    result = collector_sync.sync()
+
+    assert len(result["new_releases"]) == 2
+    assert len(result["snapshots_updated"]) == 2
+
+    release_dists = [item["distribution"] for item in result["new_releases"]]
+    assert "core" in release_dists
+    assert "contrib" in release_dists
+
+    snapshot_dists = [item["distribution"] for item in result["snapshots_updated"]]
+    assert "core" in snapshot_dists
+    assert "contrib" in snapshot_dists
+
+
+def test_sync_no_new_releases(collector_sync, sample_components, stub_scanner):
+    collector_sync.sync()
+
+    # Run again - should not process releases again
+    result = collector_sync.sync()
+
+    # No new releases
+    assert len(result["new_releases"]) == 0
+    # Main hasn't moved, so the snapshots are reported as current rather than updated
+    assert result["snapshots_updated"] == []
+    assert [item["distribution"] for item in result["snapshots_unchanged"]] == ["core", "contrib"]
+
+
+def test_sync_emits_summary_as_single_log_record(collector_sync, sample_components, caplog, stub_scanner):
+    with caplog.at_level(logging.INFO, logger="collector_watcher.collector_sync"):
         collector_sync.sync()
 
-        # Run again - should not process releases again
+    summary = [r.getMessage() for r in caplog.records if "SYNC COMPLETE" in r.getMessage()]
+    assert len(summary) == 1
+    assert "New releases processed: 2" in summary[0]
+    assert "Snapshots updated: 2" in summary[0]
+    assert "Snapshots already current: 0" in summary[0]
+
+
+def test_sync_processes_distributions_concurrently(collector_sync):
+    # Both workers must be in flight at once to pass the barrier; a sequential
+    # sync would time out waiting for the second distribution.
+    barrier = threading.Barrier(len(collector_sync.repos), timeout=10)
+    snapshot = Version(major=0, minor=112, patch=1, prerelease=("SNAPSHOT",))
+
+    def fake_process(distribution):
+        barrier.wait()
+        return None, snapshot, True
+
+    with (
+        patch.object(collector_sync, "_process_distribution_sync", side_effect=fake_process),
+        patch.object(collector_sync.inventory_manager, "save_deprecations"),
+    ):
         result = collector_sync.sync()
 
-        # No new releases
-        assert len(result["new_releases"]) == 0
-        # But snapshots should still be updated
-        assert len(result["snapshots_updated"]) == 2
+    assert [item["distribution"] for item in result["snapshots_updated"]] == ["core", "contrib"]
 
 
-def test_scan_version_snapshot_checkout(collector_sync, sample_components):
-    with patch("collector_watcher.collector_sync.ComponentScanner") as mock_scanner:
-        mock_instance = Mock()
-        mock_instance.scan_all_components.return_value = sample_components
-        mock_scanner.return_value = mock_instance
+def test_sync_propagates_distribution_failure(collector_sync):
+    def fake_process(distribution):
+        if distribution == "contrib":
+            raise RuntimeError("contrib failed")
+        return None, Version(major=0, minor=112, patch=1, prerelease=("SNAPSHOT",)), True
 
-        snapshot_version = Version(major=0, minor=113, patch=0, prerelease=("SNAPSHOT",))
+    with patch.object(collector_sync, "_process_distribution_sync", side_effect=fake_process):
+        with pytest.raises(RuntimeError, match="contrib failed"):
+            collector_sync.sync()
 
-        with patch.object(collector_sync.version_detectors["core"], "checkout_main") as mock_checkout:
-            collector_sync.scan_version("core", snapshot_version, checkout=True)
 
-            mock_checkout.assert_called_once()
+def test_scan_version_snapshot_checkout(collector_sync, sample_components, stub_scanner):
+    snapshot_version = Version(major=0, minor=113, patch=0, prerelease=("SNAPSHOT",))
 
+    with patch.object(collector_sync.version_detectors["core"], "checkout_main") as mock_checkout:
+        collector_sync.scan_version("core", snapshot_version, checkout=True)
 
-def test_scan_version_release_checkout(collector_sync, sample_components):
-    with patch("collector_watcher.collector_sync.ComponentScanner") as mock_scanner:
-        mock_instance = Mock()
-        mock_instance.scan_all_components.return_value = sample_components
-        mock_scanner.return_value = mock_instance
+        mock_checkout.assert_called_once()
 
-        release_version = Version("0.112.0")
 
-        with patch.object(collector_sync.version_detectors["core"], "checkout_version") as mock_checkout:
-            collector_sync.scan_version("core", release_version, checkout=True)
+def test_scan_version_release_checkout(collector_sync, sample_components, stub_scanner):
+    release_version = Version("0.112.0")
+
+    with patch.object(collector_sync.version_detectors["core"], "checkout_version") as mock_checkout:
+        collector_sync.scan_version("core", release_version, checkout=True)
 
-            mock_checkout.assert_called_once_with(release_version)
+        mock_checkout.assert_called_once_with(release_version)
 
 
 def test_deprecations_not_tracked_for_snapshots(collector_sync):
@@ -650,33 +735,25 @@ def test_save_version_readme_failure_does_not_block_inventory_save(
 # --- backfill / backfill_versions ---
 
 
-def test_backfill_versions_reprocesses_specified_versions(collector_sync, sample_components, temp_inventory_dir):
+def test_backfill_versions_reprocesses_specified_versions(
+    collector_sync, sample_components, temp_inventory_dir, stub_scanner
+):
     version = Version("0.111.0")
     collector_sync.save_version("core", version, sample_components)
 
-    with patch("collector_watcher.collector_sync.ComponentScanner") as mock_scanner:
-        mock_instance = Mock()
-        mock_instance.scan_all_components.return_value = sample_components
-        mock_scanner.return_value = mock_instance
-
-        result = collector_sync.backfill_versions("core", versions=[version])
+    result = collector_sync.backfill_versions("core", versions=[version])
 
     assert result == {"distribution": "core", "versions_processed": ["0.111.0"]}
     assert collector_sync.inventory_manager.version_exists("core", version)
 
 
 def test_backfill_versions_auto_detects_all_existing_versions_when_none_given(
-    collector_sync, sample_components, temp_inventory_dir
+    collector_sync, sample_components, temp_inventory_dir, stub_scanner
 ):
     collector_sync.save_version("core", Version("0.110.0"), sample_components)
     collector_sync.save_version("core", Version("0.111.0"), sample_components)
 
-    with patch("collector_watcher.collector_sync.ComponentScanner") as mock_scanner:
-        mock_instance = Mock()
-        mock_instance.scan_all_components.return_value = sample_components
-        mock_scanner.return_value = mock_instance
-
-        result = collector_sync.backfill_versions("core", versions=None)
+    result = collector_sync.backfill_versions("core", versions=None)
 
     assert sorted(result["versions_processed"]) == ["0.110.0", "0.111.0"]
 
@@ -688,7 +765,7 @@ def test_backfill_versions_with_nothing_tracked_returns_early(collector_sync, te
 
 
 def test_backfill_versions_deletes_stale_readmes_before_rescanning(
-    collector_sync, sample_components, temp_inventory_dir, temp_git_repos
+    collector_sync, sample_components, temp_inventory_dir, temp_git_repos, stub_scanner
 ):
     """
     save_versioned_inventory() already fully overwrites every component-type
@@ -710,13 +787,9 @@ def test_backfill_versions_deletes_stale_readmes_before_rescanning(
     run_git(repo_path, "tag", "-f", "v0.111.0")
     run_git(repo_path, "checkout", "main")
 
-    with patch("collector_watcher.collector_sync.ComponentScanner") as mock_scanner:
-        mock_instance = Mock()
-        mock_instance.scan_all_components.return_value = sample_components
-        mock_scanner.return_value = mock_instance
-        # First pass establishes the baseline (backfill_versions checks out
-        # the tag itself; save_version() alone would not).
-        collector_sync.backfill_versions("core", versions=[version])
+    # First pass establishes the baseline (backfill_versions checks out
+    # the tag itself; save_version() alone would not).
+    collector_sync.backfill_versions("core", versions=[version])
 
     original_map = collector_sync.inventory_manager.load_component_readme_map("core", version)
     original_hash = original_map["otlpreceiver"]
@@ -729,12 +802,7 @@ def test_backfill_versions_deletes_stale_readmes_before_rescanning(
     run_git(repo_path, "tag", "-f", "v0.111.0")
     run_git(repo_path, "checkout", "main")
 
-    with patch("collector_watcher.collector_sync.ComponentScanner") as mock_scanner:
-        mock_instance = Mock()
-        mock_instance.scan_all_components.return_value = sample_components
-        mock_scanner.return_value = mock_instance
-
-        collector_sync.backfill_versions("core", versions=[version])
+    collector_sync.backfill_versions("core", versions=[version])
 
     readme_dir_on_disk = temp_inventory_dir / "core" / "v0.111.0" / "component_readmes"
     files = [p.name for p in readme_dir_on_disk.glob("otlpreceiver-*.md")]
@@ -749,7 +817,7 @@ def test_backfill_versions_deletes_stale_readmes_before_rescanning(
 
 
 def test_backfill_versions_picks_up_readmes_for_a_previously_tracked_version(
-    collector_sync, sample_components, temp_inventory_dir, temp_git_repos
+    collector_sync, sample_components, temp_inventory_dir, temp_git_repos, stub_scanner
 ):
     """
     Regression guard for the actual production scenario this feature exists
@@ -778,12 +846,7 @@ def test_backfill_versions_picks_up_readmes_for_a_previously_tracked_version(
     run_git(repo_path, "tag", "-f", "v0.111.0")
     run_git(repo_path, "checkout", "main")
 
-    with patch("collector_watcher.collector_sync.ComponentScanner") as mock_scanner:
-        mock_instance = Mock()
-        mock_instance.scan_all_components.return_value = sample_components
-        mock_scanner.return_value = mock_instance
-
-        collector_sync.backfill_versions("core", versions=[version])
+    collector_sync.backfill_versions("core", versions=[version])
 
     readme_map = collector_sync.inventory_manager.load_component_readme_map("core", version)
     assert "otlpreceiver" in readme_map
@@ -793,18 +856,112 @@ def test_backfill_versions_picks_up_readmes_for_a_previously_tracked_version(
     assert content == "# OTLP Receiver\n\nBackfilled readme content."
 
 
+def test_backfill_versions_scans_each_version_in_its_own_worktree(
+    collector_sync, sample_components, temp_inventory_dir, temp_git_repos, stub_scanner
+):
+    repo_path = Path(temp_git_repos["core"])
+    readme = repo_path / "receiver" / "otlpreceiver" / "README.md"
+    for tag in ("v0.110.0", "v0.111.0"):
+        run_git(repo_path, "checkout", tag)
+        readme.parent.mkdir(parents=True, exist_ok=True)
+        readme.write_text(f"# README at {tag}")
+        run_git(repo_path, "add", "-A")
+        run_git(repo_path, "commit", "-m", f"readme {tag}")
+        run_git(repo_path, "tag", "-f", tag)
+    run_git(repo_path, "checkout", "main")
+    head = run_git(repo_path, "rev-parse", "HEAD")
+
+    result = collector_sync.backfill_versions("core", versions=[Version("0.111.0"), Version("0.110.0")], workers=2)
+
+    assert result["versions_processed"] == ["0.110.0", "0.111.0"]
+    # Each version's READMEs come from the worktree checked out at that version.
+    im = collector_sync.inventory_manager
+    for version in (Version("0.110.0"), Version("0.111.0")):
+        readme_hash = im.load_component_readme_map("core", version)["otlpreceiver"]
+        content = im.load_component_readme_content("core", version, "otlpreceiver", readme_hash)
+        assert content == f"# README at v{version}"
+    # The clone itself is never checked out, and the worktrees are torn down.
+    assert run_git(repo_path, "rev-parse", "HEAD") == head
+    assert len(run_git(repo_path, "worktree", "list").splitlines()) == 1
+
+
+def test_backfill_versions_keeps_versions_whose_scan_is_unchanged(collector_sync, sample_components, stub_scanner):
+    version = Version("0.111.0")
+    im = collector_sync.inventory_manager
+
+    collector_sync.backfill_versions("core", versions=[version])
+    receiver_file = im.get_version_dir("core", version) / "receiver.yaml"
+    mtime_ns = receiver_file.stat().st_mtime_ns
+
+    with patch.object(im, "delete_version", wraps=im.delete_version) as delete_version:
+        result = collector_sync.backfill_versions("core", versions=[version])
+
+    assert result["versions_processed"] == ["0.111.0"]
+    delete_version.assert_not_called()
+    assert receiver_file.stat().st_mtime_ns == mtime_ns
+    assert version in collector_sync._tracked_versions("core")
+
+
+def test_backfill_versions_reads_core_schema_once_per_rewritten_version(
+    collector_sync, sample_components, temp_git_repos, stub_scanner
+):
+    set_core_schema(temp_git_repos["core"], "type: object\n", tag="v0.112.0")
+    version = Version("0.112.0")
+    collector_sync.save_version("core", version, {})
+    copier = collector_sync.schema_copier
+
+    with patch.object(copier, "compute_schema_hash", wraps=copier.compute_schema_hash) as compute_hash:
+        collector_sync.backfill_versions("core", versions=[version])
+
+    # One hash serves both the unchanged check and the rewrite
+    compute_hash.assert_called_once()
+    # delete_version() pruned the schema only the old data referenced; the rewrite stored it again
+    schema_hash = copier.compute_schema_hash("type: object\n")
+    assert (collector_sync.inventory_manager.meta_schemas_dir() / f"{schema_hash}.yaml").exists()
+    receiver_file = collector_sync.inventory_manager.get_version_dir("core", version) / "receiver.yaml"
+    assert yaml.safe_load(receiver_file.read_text())["schema_hash"] == schema_hash
+
+
+def test_iter_scanned_versions_bounds_scans_ahead_of_consumer(collector_sync, sample_components):
+    versions = [Version(f"0.{minor}.0") for minor in range(100, 110)]
+    submitted = []
+    release_scans = threading.Event()
+
+    class CountingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, /, *args, **kwargs):
+            submitted.append(args[1])
+            return super().submit(fn, *args, **kwargs)
+
+    def fake_scan(distribution, version, free_worktrees):
+        # Everything after the first version stays in flight until the look-ahead has been checked
+        if version != versions[0]:
+            assert release_scans.wait(timeout=10)
+        return sample_components, {}
+
+    with (
+        patch.object(collector_sync, "_scan_in_worktree", side_effect=fake_scan),
+        patch("collector_watcher.collector_sync.ThreadPoolExecutor", CountingExecutor),
+    ):
+        scans = collector_sync._iter_scanned_versions("core", versions, workers=2)
+        first_version, _, _ = next(scans)
+        # The generator is suspended at its first yield, so every submission so far is final
+        submitted_before_first_save = list(submitted)
+        release_scans.set()
+        rest = [version for version, _, _ in scans]
+
+    assert first_version == versions[0]
+    assert submitted_before_first_save == versions[: _SCAN_LOOKAHEAD_PER_WORKER * 2]
+    assert rest == versions[1:]
+    assert submitted == versions
+
+
 def test_backfill_processes_all_distributions_when_none_specified(
-    collector_sync, sample_components, temp_inventory_dir
+    collector_sync, sample_components, temp_inventory_dir, stub_scanner
 ):
     collector_sync.save_version("core", Version("0.111.0"), sample_components)
     collector_sync.save_version("contrib", Version("0.111.0"), sample_components)
 
-    with patch("collector_watcher.collector_sync.ComponentScanner") as mock_scanner:
-        mock_instance = Mock()
-        mock_instance.scan_all_components.return_value = sample_components
-        mock_scanner.return_value = mock_instance
-
-        summary = collector_sync.backfill(versions_by_dist=None)
+    summary = collector_sync.backfill(versions_by_dist=None)
 
     distributions_processed = {item["distribution"] for item in summary["backfilled"]}
     assert distributions_processed == {"core", "contrib"}
@@ -820,7 +977,7 @@ def _seed(inventory_manager, distribution, version, sample_components):
 
 
 def test_backfill_prune_unlisted_removes_unlisted_release_versions(
-    collector_sync, sample_components, temp_inventory_dir
+    collector_sync, sample_components, temp_inventory_dir, stub_scanner
 ):
     im = collector_sync.inventory_manager
     keep = Version("0.112.0")
@@ -828,12 +985,7 @@ def test_backfill_prune_unlisted_removes_unlisted_release_versions(
     for version in [Version("0.110.0"), Version("0.111.0"), keep, snapshot]:
         _seed(im, "core", version, sample_components)
 
-    with patch("collector_watcher.collector_sync.ComponentScanner") as mock_scanner:
-        mock_instance = Mock()
-        mock_instance.scan_all_components.return_value = sample_components
-        mock_scanner.return_value = mock_instance
-
-        summary = collector_sync.backfill(versions_by_dist={"core": [keep]}, prune_unlisted=True)
+    summary = collector_sync.backfill(versions_by_dist={"core": [keep]}, prune_unlisted=True)
 
     # Only the listed version is regenerated.
     assert summary["backfilled"][0]["versions_processed"] == ["0.112.0"]
@@ -846,19 +998,16 @@ def test_backfill_prune_unlisted_removes_unlisted_release_versions(
     assert im.version_exists("core", snapshot)
 
 
-def test_backfill_without_prune_keeps_unlisted_versions(collector_sync, sample_components, temp_inventory_dir):
+def test_backfill_without_prune_keeps_unlisted_versions(
+    collector_sync, sample_components, temp_inventory_dir, stub_scanner
+):
     im = collector_sync.inventory_manager
     keep = Version("0.112.0")
     other = Version("0.110.0")
     _seed(im, "core", keep, sample_components)
     _seed(im, "core", other, sample_components)
 
-    with patch("collector_watcher.collector_sync.ComponentScanner") as mock_scanner:
-        mock_instance = Mock()
-        mock_instance.scan_all_components.return_value = sample_components
-        mock_scanner.return_value = mock_instance
-
-        collector_sync.backfill(versions_by_dist={"core": [keep]})
+    collector_sync.backfill(versions_by_dist={"core": [keep]})
 
     # Default behaviour leaves the unlisted version untouched.
     assert im.version_exists("core", keep)
@@ -866,7 +1015,7 @@ def test_backfill_without_prune_keeps_unlisted_versions(collector_sync, sample_c
 
 
 def test_backfill_prune_unlisted_resets_deprecations_for_distribution(
-    collector_sync, sample_components, temp_inventory_dir
+    collector_sync, sample_components, temp_inventory_dir, stub_scanner
 ):
     im = collector_sync.inventory_manager
     keep = Version("0.112.0")
@@ -876,12 +1025,7 @@ def test_backfill_prune_unlisted_resets_deprecations_for_distribution(
     # Pre-existing deprecation entry that references a now-pruned version.
     collector_sync.deprecations["core"]["receiver"] = [{"name": "gonereceiver", "deprecated_in_version": "0.111.0"}]
 
-    with patch("collector_watcher.collector_sync.ComponentScanner") as mock_scanner:
-        mock_instance = Mock()
-        mock_instance.scan_all_components.return_value = sample_components
-        mock_scanner.return_value = mock_instance
-
-        collector_sync.backfill(versions_by_dist={"core": [keep]}, prune_unlisted=True)
+    collector_sync.backfill(versions_by_dist={"core": [keep]}, prune_unlisted=True)
 
     # The stale entry is cleared so deprecations.yaml reflects only surviving versions.
     assert collector_sync.deprecations["core"]["receiver"] == []
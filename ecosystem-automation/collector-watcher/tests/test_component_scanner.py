@@ -14,58 +14,62 @@
 #
 """Tests for component scanner."""
 
-import shutil
-import tempfile
-from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from collector_watcher.component_scanner import ComponentScanner
+from collector_watcher.type_defs import COMPONENT_TYPES
+
+# Repository-relative file -> content; directories are implied by the paths.
+_MOCK_REPO_FILES = {
+    "receiver/otlpreceiver/go.mod": "",
+    "receiver/otlpreceiver/metadata.yaml": "type: otlp",
+    "receiver/customreceiver/go.mod": "",
+    "processor/batchprocessor/go.mod": "",
+    "processor/batchprocessor/metadata.yaml": "type: batch",
+    # Exporter without go.mod but with .go files
+    "exporter/loggingexporter/exporter.go": "",
+    "exporter/loggingexporter/metadata.yaml": "type: logging",
+    # Internal, testdata and hidden directories (should be ignored)
+    "receiver/internal/go.mod": "",
+    "processor/testdata/go.mod": "",
+    "exporter/.hidden/go.mod": "",
+}
+
+_NESTED_REPO_FILES = {
+    # A regular extension
+    "extension/healthcheckextension/go.mod": "",
+    "extension/healthcheckextension/metadata.yaml": "type: health_check",
+    # Encoding extensions (nested); the parent has a .go file but no go.mod
+    "extension/encoding/encoding.go": "",
+    "extension/encoding/otlpencodingextension/go.mod": "",
+    "extension/encoding/otlpencodingextension/metadata.yaml": "type: otlp_encoding",
+    "extension/encoding/jsonlogencodingextension/go.mod": "",
+    "extension/encoding/jsonlogencodingextension/metadata.yaml": "type: jsonlog_encoding",
+    # Observer and storage extensions (nested)
+    "extension/observer/hostobserver/go.mod": "",
+    "extension/observer/hostobserver/metadata.yaml": "type: host_observer",
+    "extension/storage/filestorage/go.mod": "",
+    "extension/storage/filestorage/metadata.yaml": "type: file_storage",
+    # Internal directory inside nested (should be ignored)
+    "extension/encoding/internal/go.mod": "",
+}
+
+
+def _write_tree(repo_path, files):
+    """Write ``files`` under ``repo_path``, creating each parent directory once."""
+    paths = {rel_path: repo_path / rel_path for rel_path in files}
+    for directory in {path.parent for path in paths.values()}:
+        directory.mkdir(parents=True, exist_ok=True)
+    for rel_path, path in paths.items():
+        path.write_text(files[rel_path])
+    return repo_path
 
 
 @pytest.fixture
-def mock_repo():
+def mock_repo(tmp_path):
     """Create a temporary mock repository structure."""
-    temp_dir = tempfile.mkdtemp()
-    repo_path = Path(temp_dir)
-
-    receiver_with_meta = repo_path / "receiver" / "otlpreceiver"
-    receiver_with_meta.mkdir(parents=True)
-    (receiver_with_meta / "go.mod").touch()
-    (receiver_with_meta / "metadata.yaml").write_text("type: otlp")
-
-    receiver_no_meta = repo_path / "receiver" / "customreceiver"
-    receiver_no_meta.mkdir(parents=True)
-    (receiver_no_meta / "go.mod").touch()
-
-    processor_with_meta = repo_path / "processor" / "batchprocessor"
-    processor_with_meta.mkdir(parents=True)
-    (processor_with_meta / "go.mod").touch()
-    (processor_with_meta / "metadata.yaml").write_text("type: batch")
-
-    # Exporter without go.mod but with .go files
-    exporter_go_files = repo_path / "exporter" / "loggingexporter"
-    exporter_go_files.mkdir(parents=True)
-    (exporter_go_files / "exporter.go").touch()
-    (exporter_go_files / "metadata.yaml").write_text("type: logging")
-
-    # Internal directory (should be ignored)
-    internal_dir = repo_path / "receiver" / "internal"
-    internal_dir.mkdir(parents=True)
-    (internal_dir / "go.mod").touch()
-
-    # Testdata directory (should be ignored)
-    testdata_dir = repo_path / "processor" / "testdata"
-    testdata_dir.mkdir(parents=True)
-    (testdata_dir / "go.mod").touch()
-
-    # Hidden directory (should be ignored)
-    hidden_dir = repo_path / "exporter" / ".hidden"
-    hidden_dir.mkdir(parents=True)
-    (hidden_dir / "go.mod").touch()
-
-    yield repo_path
-
-    shutil.rmtree(temp_dir)
+    return _write_tree(tmp_path / "repo", _MOCK_REPO_FILES)
 
 
 def test_scan_receivers(mock_repo):
@@ -127,122 +131,61 @@ def test_scan_all_components(mock_repo):
 
 
 @pytest.fixture
-def mock_repo_with_nested():
+def mock_repo_with_nested(tmp_path):
     """Create a temporary mock repository with nested extension directories."""
-    temp_dir = tempfile.mkdtemp()
-    repo_path = Path(temp_dir)
-
-    # Create a regular extension
-    regular_ext = repo_path / "extension" / "healthcheckextension"
-    regular_ext.mkdir(parents=True)
-    (regular_ext / "go.mod").touch()
-    (regular_ext / "metadata.yaml").write_text("type: health_check")
-
-    # Create encoding extensions (nested)
-    encoding_dir = repo_path / "extension" / "encoding"
-    encoding_dir.mkdir(parents=True)
-    (encoding_dir / "encoding.go").touch()  # Parent has .go file but no go.mod
-
-    encoding_ext1 = encoding_dir / "otlpencodingextension"
-    encoding_ext1.mkdir(parents=True)
-    (encoding_ext1 / "go.mod").touch()
-    (encoding_ext1 / "metadata.yaml").write_text("type: otlp_encoding")
+    return _write_tree(tmp_path / "repo", _NESTED_REPO_FILES)
 
-    encoding_ext2 = encoding_dir / "jsonlogencodingextension"
-    encoding_ext2.mkdir(parents=True)
-    (encoding_ext2 / "go.mod").touch()
-    (encoding_ext2 / "metadata.yaml").write_text("type: jsonlog_encoding")
 
-    # Create observer extensions (nested)
-    observer_dir = repo_path / "extension" / "observer"
-    observer_dir.mkdir(parents=True)
+@pytest.fixture(scope="module")
+def nested_extensions(tmp_path_factory):
+    """Extensions scanned once from a nested mock repository and shared by the read-only tests below."""
+    repo_path = _write_tree(tmp_path_factory.mktemp("nested") / "repo", _NESTED_REPO_FILES)
+    return ComponentScanner(str(repo_path)).scan_component_type("extension")
 
-    observer_ext = observer_dir / "hostobserver"
-    observer_ext.mkdir(parents=True)
-    (observer_ext / "go.mod").touch()
-    (observer_ext / "metadata.yaml").write_text("type: host_observer")
 
-    # Create storage extensions (nested)
-    storage_dir = repo_path / "extension" / "storage"
-    storage_dir.mkdir(parents=True)
-
-    storage_ext = storage_dir / "filestorage"
-    storage_ext.mkdir(parents=True)
-    (storage_ext / "go.mod").touch()
-    (storage_ext / "metadata.yaml").write_text("type: file_storage")
-
-    # Create internal directory inside nested (should be ignored)
-    internal_dir = encoding_dir / "internal"
-    internal_dir.mkdir(parents=True)
-    (internal_dir / "go.mod").touch()
-
-    yield repo_path
-
-    # Cleanup
-    shutil.rmtree(temp_dir)
-
-
-def test_scan_nested_encoding_extensions(mock_repo_with_nested):
+def test_scan_nested_encoding_extensions(nested_extensions):
     """Test scanning nested encoding extensions."""
-    scanner = ComponentScanner(str(mock_repo_with_nested))
-    extensions = scanner.scan_component_type("extension")
-
     # Should find 5 extensions total
-    assert len(extensions) == 5
+    assert len(nested_extensions) == 5
 
     # Find encoding extensions
-    encoding_exts = [e for e in extensions if e.get("subtype") == "encoding"]
+    encoding_exts = [e for e in nested_extensions if e.get("subtype") == "encoding"]
     assert len(encoding_exts) == 2
     assert any(e["name"] == "otlpencodingextension" for e in encoding_exts)
     assert any(e["name"] == "jsonlogencodingextension" for e in encoding_exts)
 
 
-def test_scan_nested_observer_extensions(mock_repo_with_nested):
+def test_scan_nested_observer_extensions(nested_extensions):
     """Test scanning nested observer extensions."""
-    scanner = ComponentScanner(str(mock_repo_with_nested))
-    extensions = scanner.scan_component_type("extension")
-
-    observer_exts = [e for e in extensions if e.get("subtype") == "observer"]
+    observer_exts = [e for e in nested_extensions if e.get("subtype") == "observer"]
     assert len(observer_exts) == 1
     assert observer_exts[0]["name"] == "hostobserver"
 
 
-def test_scan_nested_storage_extensions(mock_repo_with_nested):
+def test_scan_nested_storage_extensions(nested_extensions):
     """Test scanning nested storage extensions."""
-    scanner = ComponentScanner(str(mock_repo_with_nested))
-    extensions = scanner.scan_component_type("extension")
-
-    storage_exts = [e for e in extensions if e.get("subtype") == "storage"]
+    storage_exts = [e for e in nested_extensions if e.get("subtype") == "storage"]
     assert len(storage_exts) == 1
     assert storage_exts[0]["name"] == "filestorage"
 
 
-def test_scan_regular_extensions_no_subtype(mock_repo_with_nested):
+def test_scan_regular_extensions_no_subtype(nested_extensions):
     """Test that regular extensions don't have a subtype field."""
-    scanner = ComponentScanner(str(mock_repo_with_nested))
-    extensions = scanner.scan_component_type("extension")
-
-    regular_exts = [e for e in extensions if e.get("subtype") is None]
+    regular_exts = [e for e in nested_extensions if e.get("subtype") is None]
     assert len(regular_exts) == 1
     assert regular_exts[0]["name"] == "healthcheckextension"
 
 
-def test_nested_excludes_internal_directories(mock_repo_with_nested):
+def test_nested_excludes_internal_directories(nested_extensions):
     """Test that internal directories inside nested dirs are excluded."""
-    scanner = ComponentScanner(str(mock_repo_with_nested))
-    extensions = scanner.scan_component_type("extension")
-
     # Should not find internal directory
-    names = [e["name"] for e in extensions]
+    names = [e["name"] for e in nested_extensions]
     assert "internal" not in names
 
 
-def test_subtype_field_in_component_info(mock_repo_with_nested):
+def test_subtype_field_in_component_info(nested_extensions):
     """Test that subtype field is included in component info."""
-    scanner = ComponentScanner(str(mock_repo_with_nested))
-    extensions = scanner.scan_component_type("extension")
-
-    encoding_ext = next(e for e in extensions if e["name"] == "otlpencodingextension")
+    encoding_ext = next(e for e in nested_extensions if e["name"] == "otlpencodingextension")
     assert encoding_ext["subtype"] == "encoding"
     assert "metadata" in encoding_ext
 
@@ -268,3 +211,67 @@ def test_scan_empty_component_type_directory(mock_repo):
     scanner = ComponentScanner(str(mock_repo))
     connectors = scanner.scan_component_type("connector")
     assert len(connectors) == 0
+
+
+def test_scan_component_type_sorted_by_name_and_skips_files(mock_repo):
+    """Components come back in name order; plain files beside them are ignored."""
+    (mock_repo / "receiver" / "README.md").write_text("# Receivers")
+    (mock_repo / "receiver" / "go.mod").touch()
+
+    scanner = ComponentScanner(str(mock_repo))
+    receivers = scanner.scan_component_type("receiver")
+
+    assert [r["name"] for r in receivers] == ["customreceiver", "otlpreceiver"]
+
+
+def test_directory_without_go_code_is_not_a_component(mock_repo):
+    docs_only = mock_repo / "receiver" / "docsreceiver"
+    docs_only.mkdir()
+    (docs_only / "README.md").write_text("# Not a component")
+    (docs_only / "metadata.yaml").write_text("type: docs")
+
+    scanner = ComponentScanner(str(mock_repo))
+    receivers = scanner.scan_component_type("receiver")
+
+    assert not any(r["name"] == "docsreceiver" for r in receivers)
+
+
+def test_scan_all_components_matches_per_type_scans(mock_repo_with_nested):
+    scanner = ComponentScanner(str(mock_repo_with_nested))
+
+    components = scanner.scan_all_components()
+
+    assert list(components) == COMPONENT_TYPES
+    assert components == {
+        component_type: scanner.scan_component_type(component_type) for component_type in COMPONENT_TYPES
+    }
+
+
+@pytest.mark.parametrize(
+    ("name", "valid"),
+    [
+        ("otlpreceiver", True),
+        (".hidden", False),
+        ("_private", False),
+        ("internal", False),
+        ("testdata", False),
+        ("receivertest", False),
+        ("scraperhelper", False),
+        ("endpointswatcher", False),
+    ],
+)
+def test_is_valid_component_name(mock_repo, name, valid):
+    scanner = ComponentScanner(str(mock_repo))
+    assert scanner._is_valid_component_name(name) is valid
+
+
+def test_scan_all_components_skips_absent_type_directories(mock_repo):
+    scanner = ComponentScanner(str(mock_repo))
+
+    with patch.object(scanner, "scan_component_type", wraps=scanner.scan_component_type) as scan_type:
+        components = scanner.scan_all_components()
+
+    assert sorted(call.args[0] for call in scan_type.call_args_list) == ["exporter", "processor", "receiver"]
+    assert components["connector"] == []
+    assert components["extension"] == []
+    assert list(components) == COMPONENT_TYPES
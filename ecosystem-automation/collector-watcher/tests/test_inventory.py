@@ -15,27 +15,24 @@
 """Tests for inventory manager."""
 
 import os
-import shutil
-import tempfile
 import time
-from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
-from collector_watcher.inventory_manager import InventoryManager
+from collector_watcher.inventory_manager import InventoryManager, _parse_version_dir_name
 from semantic_version import Version
 from watcher_common.content_hashing import compute_content_hash
 
 
 @pytest.fixture
-def temp_inventory_dir():
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir)
+def temp_inventory_dir(tmp_path):
+    return tmp_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_components():
+    """Scanner output shared by every test in the session; the tests only read it."""
     return {
         "connector": [],
         "exporter": [
@@ -52,12 +49,12 @@ def sample_components():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_version():
     return Version("0.112.0")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_snapshot_version():
     return Version(major=0, minor=113, patch=0, prerelease=("SNAPSHOT",))
 
@@ -87,6 +84,37 @@ def test_save_versioned_inventory(temp_inventory_dir, sample_components, sample_
     assert len(loaded["components"]) == 2
 
 
+def test_save_versioned_inventory_matches_single_dump(temp_inventory_dir, sample_version):
+    """Writing component by component must produce the same bytes as dumping the whole mapping."""
+    manager = InventoryManager(str(temp_inventory_dir))
+    components = {
+        "receiver": [
+            {
+                "name": "otlpreceiver",
+                "metadata": {
+                    "type": "otlp",
+                    "status": {"class": "receiver", "stability": {"beta": ["logs"], "stable": ["metrics", "traces"]}},
+                    "description": "Receives data via gRPC or HTTP using OTLP format. " * 4 + "Ünïcödé ✓",
+                },
+            },
+            {"name": "customreceiver", "has_metadata": False},
+        ],
+    }
+
+    manager.save_versioned_inventory("core", sample_version, components, "opentelemetry-collector", "abc")
+
+    written = (manager.get_version_dir("core", sample_version) / "receiver.yaml").read_text(encoding="utf-8")
+    expected = {
+        "distribution": "core",
+        "version": "0.112.0",
+        "repository": "opentelemetry-collector",
+        "component_type": "receiver",
+        "schema_hash": "abc",
+        "components": components["receiver"],
+    }
+    assert written == yaml.dump(expected, default_flow_style=False, sort_keys=False, allow_unicode=True)
+
+
 def test_save_versioned_inventory_includes_schema_hash(temp_inventory_dir, sample_components, sample_version):
     manager = InventoryManager(str(temp_inventory_dir))
 
@@ -168,6 +196,61 @@ def test_load_versioned_inventory_backward_compat_missing_schema_hash(
     assert loaded["schema_hash"] == "unknown"
 
 
+def test_load_versioned_inventory_reuses_parse_of_unchanged_files(
+    temp_inventory_dir, sample_components, sample_version
+):
+    manager = InventoryManager(str(temp_inventory_dir))
+    manager.save_versioned_inventory("core", sample_version, sample_components, "opentelemetry-collector")
+
+    with patch("collector_watcher.inventory_manager.yaml.load", wraps=yaml.load) as load:
+        first = manager.load_versioned_inventory("core", sample_version)
+        first["components"]["receiver"].clear()
+        second = manager.load_versioned_inventory("core", sample_version)
+
+    assert load.call_count == 5
+    assert second["components"] == sample_components
+
+
+def test_load_versioned_inventory_reparses_changed_files(temp_inventory_dir, sample_components, sample_version):
+    manager = InventoryManager(str(temp_inventory_dir))
+    manager.save_versioned_inventory("core", sample_version, sample_components, "opentelemetry-collector")
+    manager.load_versioned_inventory("core", sample_version)
+
+    # Rewritten outside this manager, as a git checkout of the registry would
+    receiver_file = manager.get_version_dir("core", sample_version) / "receiver.yaml"
+    data = yaml.safe_load(receiver_file.read_text())
+    data["components"].append({"name": "newreceiver", "has_metadata": False})
+    receiver_file.write_text(yaml.dump(data))
+
+    loaded = manager.load_versioned_inventory("core", sample_version)
+
+    assert [c["name"] for c in loaded["components"]["receiver"]] == ["otlpreceiver", "customreceiver", "newreceiver"]
+
+
+def test_matches_saved_inventory(temp_inventory_dir, sample_components, sample_version):
+    manager = InventoryManager(str(temp_inventory_dir))
+    readmes = [("otlpreceiver", "# OTLP")]
+    manager.save_versioned_inventory("core", sample_version, sample_components, "opentelemetry-collector", "abc")
+    manager.save_component_readmes("core", sample_version, readmes)
+
+    def matches(components=sample_components, schema_hash="abc", readmes=readmes):
+        return manager.matches_saved_inventory(
+            "core", sample_version, components, "opentelemetry-collector", schema_hash, readmes
+        )
+
+    assert matches()
+    assert not matches(components={**sample_components, "connector": [{"name": "forwardconnector"}]})
+    assert not matches(schema_hash="def")
+    assert not matches(readmes=[("otlpreceiver", "# OTLP, updated")])
+    assert not matches(readmes=[])
+
+
+def test_matches_saved_inventory_false_for_missing_version(temp_inventory_dir, sample_components, sample_version):
+    manager = InventoryManager(str(temp_inventory_dir))
+
+    assert not manager.matches_saved_inventory("core", sample_version, sample_components, "repo", "abc", [])
+
+
 def test_load_nonexistent_versioned_inventory(temp_inventory_dir, sample_version):
     manager = InventoryManager(str(temp_inventory_dir))
 
@@ -305,6 +388,16 @@ def test_list_versions(temp_inventory_dir, sample_components):
     assert str(versions[2]) == "0.110.0"
 
 
+def test_list_versions_skips_non_version_directories(temp_inventory_dir, sample_components, sample_version):
+    manager = InventoryManager(str(temp_inventory_dir))
+    manager.save_versioned_inventory("core", sample_version, sample_components, "opentelemetry-collector")
+    (temp_inventory_dir / "core" / "not-a-version").mkdir()
+
+    # Listed twice so the second call is served from the parse cache.
+    assert manager.list_versions("core") == [sample_version]
+    assert manager.list_versions("core") == [sample_version]
+
+
 def test_list_snapshot_versions(temp_inventory_dir, sample_components):
     manager = InventoryManager(str(temp_inventory_dir))
 
@@ -328,6 +421,24 @@ def test_list_snapshot_versions(temp_inventory_dir, sample_components):
     assert all(v.prerelease for v in snapshots)
 
 
+def test_list_snapshot_versions_parses_only_prerelease_names(temp_inventory_dir, sample_components):
+    manager = InventoryManager(str(temp_inventory_dir))
+    snapshot = Version(major=0, minor=113, patch=0, prerelease=("SNAPSHOT",))
+    for version in (Version("0.111.0"), Version("0.112.0"), snapshot):
+        manager.save_versioned_inventory("contrib", version, sample_components, "opentelemetry-collector-contrib")
+    (temp_inventory_dir / "contrib" / "not-a-version").mkdir()
+
+    with patch(
+        "collector_watcher.inventory_manager._parse_version_dir_name",
+        wraps=_parse_version_dir_name,
+    ) as parse:
+        snapshots = manager.list_snapshot_versions("contrib")
+
+    assert snapshots == [snapshot]
+    # Release directory names are never handed to the version parser
+    assert {call.args[0] for call in parse.call_args_list} == {"not-a-version", "v0.113.0-SNAPSHOT"}
+
+
 def test_list_release_versions(temp_inventory_dir, sample_components):
     manager = InventoryManager(str(temp_inventory_dir))
 
@@ -384,6 +495,40 @@ def test_cleanup_snapshots(temp_inventory_dir, sample_components):
     assert not manager.version_exists("contrib", v3)
 
 
+def test_cleanup_snapshots_only_removes_canonical_version_dirs(temp_inventory_dir, sample_components):
+    manager = InventoryManager(str(temp_inventory_dir))
+    snapshot = Version(major=0, minor=113, patch=0, prerelease=("SNAPSHOT",))
+    manager.save_versioned_inventory(
+        distribution="contrib",
+        version=snapshot,
+        components=sample_components,
+        repository="opentelemetry-collector-contrib",
+    )
+    dist_dir = temp_inventory_dir / "contrib"
+    (dist_dir / "0.112.1-SNAPSHOT").mkdir()
+    (dist_dir / "vv0.1.0-SNAPSHOT").mkdir()
+
+    removed = manager.cleanup_snapshots("contrib")
+
+    assert removed == 1
+    assert not manager.version_exists("contrib", snapshot)
+    assert (dist_dir / "0.112.1-SNAPSHOT").is_dir()
+    assert (dist_dir / "vv0.1.0-SNAPSHOT").is_dir()
+
+
+def test_cleanup_snapshots_without_distribution_dir(temp_inventory_dir):
+    manager = InventoryManager(str(temp_inventory_dir))
+
+    assert manager.cleanup_snapshots("contrib") == 0
+
+
+def test_list_versions_without_distribution_dir(temp_inventory_dir):
+    manager = InventoryManager(str(temp_inventory_dir))
+
+    assert manager.list_versions("contrib") == []
+    assert manager.list_snapshot_versions("contrib") == []
+
+
 def test_prune_release_versions_not_in(temp_inventory_dir, sample_components):
     manager = InventoryManager(str(temp_inventory_dir))
 
@@ -482,6 +627,24 @@ def test_version_exists(temp_inventory_dir, sample_components, sample_version):
     assert manager.version_exists("contrib", sample_version)
 
 
+def test_snapshot_source_round_trip_per_distribution(temp_inventory_dir):
+    manager = InventoryManager(str(temp_inventory_dir))
+    snapshot = Version("0.113.1-SNAPSHOT")
+
+    assert manager.load_snapshot_source("core") is None
+
+    manager.save_snapshot_source("core", snapshot, "abc123", "0123456789ab")
+    manager.save_snapshot_source("contrib", snapshot, "def456", "0123456789ab")
+
+    assert manager.load_snapshot_source("core") == {
+        "version": "0.113.1-SNAPSHOT",
+        "source_commit": "abc123",
+        "schema_hash": "0123456789ab",
+    }
+    assert manager.load_snapshot_source("contrib")["source_commit"] == "def456"
+    assert (temp_inventory_dir / "meta" / "snapshot_sources.yaml").exists()
+
+
 def test_versioned_inventory_separate_distributions_stored_separately(
     temp_inventory_dir, sample_components, sample_version
 ):
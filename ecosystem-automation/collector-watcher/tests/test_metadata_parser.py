@@ -14,9 +14,9 @@
 #
 """Tests for metadata parser."""
 
-import shutil
-import tempfile
+import logging
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from collector_watcher.metadata_parser import (
@@ -28,43 +28,38 @@ from collector_watcher.metadata_parser import (
 
 
 @pytest.fixture
-def temp_component_dir():
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir)
+def temp_component_dir(tmp_path):
+    return tmp_path
 
 
 def create_metadata_file(component_dir: Path, content: str):
     metadata_path = component_dir / "metadata.yaml"
-    metadata_path.write_text(content)
+    # Written as the UTF-8 bytes MetadataParser reads back, with no newline translation
+    metadata_path.write_bytes(content.encode("utf-8"))
     return metadata_path
 
 
-def test_parse_type_field(temp_component_dir):
-    create_metadata_file(temp_component_dir, "type: otlp")
-    parser = MetadataParser(temp_component_dir)
-    metadata = parser.parse()
+def test_parse_type_field():
+    metadata = MetadataParser.from_bytes("type: otlp".encode())
 
     assert metadata is not None
     assert metadata["type"] == "otlp"
 
 
-def test_parse_status_basic(temp_component_dir):
+def test_parse_status_basic():
     content = """
 type: test
 status:
   class: receiver
   distributions: [contrib, custom]
 """
-    create_metadata_file(temp_component_dir, content)
-    parser = MetadataParser(temp_component_dir)
-    metadata = parser.parse()
+    metadata = MetadataParser.from_bytes(content.encode())
 
     assert metadata["status"]["class"] == "receiver"
     assert metadata["status"]["distributions"] == ["contrib", "custom"]
 
 
-def test_parse_status_stability(temp_component_dir):
+def test_parse_status_stability():
     content = """
 type: test
 status:
@@ -74,9 +69,7 @@ status:
     beta: [logs]
     alpha: [profiles]
 """
-    create_metadata_file(temp_component_dir, content)
-    parser = MetadataParser(temp_component_dir)
-    metadata = parser.parse()
+    metadata = MetadataParser.from_bytes(content.encode())
 
     stability = metadata["status"]["stability"]
     # Should be sorted alphabetically by level
@@ -87,22 +80,20 @@ status:
     assert stability["alpha"] == ["profiles"]
 
 
-def test_parse_status_unsupported_platforms(temp_component_dir):
+def test_parse_status_unsupported_platforms():
     content = """
 type: test
 status:
   class: receiver
   unsupported_platforms: [windows, linux, darwin]
 """
-    create_metadata_file(temp_component_dir, content)
-    parser = MetadataParser(temp_component_dir)
-    metadata = parser.parse()
+    metadata = MetadataParser.from_bytes(content.encode())
 
     # Should be sorted
     assert metadata["status"]["unsupported_platforms"] == ["darwin", "linux", "windows"]
 
 
-def test_parse_attributes_with_deterministic_ordering(temp_component_dir):
+def test_parse_attributes_with_deterministic_ordering():
     content = """
 type: test
 attributes:
@@ -117,9 +108,7 @@ attributes:
     type: string
     enum: [z_value, a_value, m_value]
 """
-    create_metadata_file(temp_component_dir, content)
-    parser = MetadataParser(temp_component_dir)
-    metadata = parser.parse()
+    metadata = MetadataParser.from_bytes(content.encode())
 
     attrs = metadata["attributes"]
     # Attributes should be sorted by key
@@ -128,7 +117,7 @@ attributes:
     assert attrs["middle_attr"]["enum"] == ["a_value", "m_value", "z_value"]
 
 
-def test_parse_metrics_with_deterministic_ordering(temp_component_dir):
+def test_parse_metrics_with_deterministic_ordering():
     content = """
 type: test
 metrics:
@@ -148,9 +137,7 @@ metrics:
     gauge:
       value_type: int
 """
-    create_metadata_file(temp_component_dir, content)
-    parser = MetadataParser(temp_component_dir)
-    metadata = parser.parse()
+    metadata = MetadataParser.from_bytes(content.encode())
 
     metrics = metadata["metrics"]
     # Metrics should be sorted by key
@@ -159,7 +146,7 @@ metrics:
     assert metrics["system.cpu.usage"]["attributes"] == ["cpu", "state"]
 
 
-def test_parse_resource_attributes(temp_component_dir):
+def test_parse_resource_attributes():
     content = """
 type: test
 resource_attributes:
@@ -170,9 +157,7 @@ resource_attributes:
     description: Service name
     type: string
 """
-    create_metadata_file(temp_component_dir, content)
-    parser = MetadataParser(temp_component_dir)
-    metadata = parser.parse()
+    metadata = MetadataParser.from_bytes(content.encode())
 
     res_attrs = metadata["resource_attributes"]
     assert list(res_attrs.keys()) == ["host.name", "service.name"]
@@ -226,7 +211,7 @@ attributes:
     assert list(metadata1["attributes"].keys()) == list(metadata2["attributes"].keys())
 
 
-def test_parse_complete_metadata(temp_component_dir):
+def test_parse_complete_metadata():
     content = """
 display_name: Active Directory DS Receiver
 type: active_directory_ds
@@ -258,9 +243,7 @@ metrics:
     stability:
       level: development
 """
-    create_metadata_file(temp_component_dir, content)
-    parser = MetadataParser(temp_component_dir)
-    metadata = parser.parse()
+    metadata = MetadataParser.from_bytes(content.encode())
 
     assert metadata is not None
     assert metadata["display_name"] == "Active Directory DS Receiver"
@@ -341,6 +324,20 @@ def test_has_metadata_returns_false_for_missing_file(temp_component_dir):
     assert parser.has_metadata() is False
 
 
+def test_from_bytes_matches_parse_of_the_same_file(temp_component_dir):
+    content = "type: otlp\nstatus:\n  class: receiver\n  distributions: [core, contrib]\n"
+    create_metadata_file(temp_component_dir, content)
+
+    assert MetadataParser.from_bytes(content.encode()) == MetadataParser(temp_component_dir).parse()
+
+
+def test_from_bytes_returns_none_for_malformed_yaml(caplog):
+    with caplog.at_level(logging.WARNING):
+        assert MetadataParser.from_bytes(b"type: test\ninvalid: [unclosed list\n") is None
+
+    assert "Failed to parse <bytes>" in caplog.text
+
+
 def test_parse_returns_none_for_missing_file(temp_component_dir):
     """Test that parse() returns None when metadata.yaml doesn't exist."""
     parser = MetadataParser(temp_component_dir)
@@ -348,8 +345,6 @@ def test_parse_returns_none_for_missing_file(temp_component_dir):
 
 
 def test_parse_with_logging_on_error(temp_component_dir, caplog):
-    import logging
-
     content = """
 type: test
 status:
@@ -367,7 +362,7 @@ status:
     assert "Failed to parse" in caplog.text
 
 
-def test_sanitize_description_whitespace_normalization(temp_component_dir):
+def test_sanitize_description_whitespace_normalization():
     """Test line breaks, extra spaces, and tabs."""
     content = """
 type: test
@@ -376,9 +371,7 @@ description: |
 
   cumulative, by accumulating samples in memory.
 """
-    create_metadata_file(temp_component_dir, content)
-    parser = MetadataParser(temp_component_dir)
-    metadata = parser.parse()
+    metadata = MetadataParser.from_bytes(content.encode())
 
     assert metadata is not None
     expected = (
@@ -389,7 +382,7 @@ description: |
     assert "\n" not in metadata["description"]
 
 
-def test_sanitize_descriptions_in_attributes_and_metrics(temp_component_dir):
+def test_sanitize_descriptions_in_attributes_and_metrics():
     """Test sanitization applies to attribute, metric, and resource attribute descriptions."""
     content = """
 type: test
@@ -413,9 +406,7 @@ resource_attributes:
       running the collector.
     type: string
 """
-    create_metadata_file(temp_component_dir, content)
-    parser = MetadataParser(temp_component_dir)
-    metadata = parser.parse()
+    metadata = MetadataParser.from_bytes(content.encode())
 
     assert metadata["attributes"]["test_attr"]["description"] == "Multi-line attribute description with line breaks."
     assert (
@@ -613,6 +604,20 @@ def test_parser_v1_sorts_deeply_nested_passthrough_dicts():
     )
 
 
+def test_parser_v1_sorts_values_the_normalizers_pass_through():
+    """Values a normalizer keeps rather than rebuilds (a non-dict attribute
+    entry, a non-list `distributions`) are key-sorted like everything else."""
+    raw = {
+        "type": "test",
+        "status": {"class": "receiver", "distributions": {"contrib": {"since": "1", "alias": "x"}}},
+        "attributes": {"a": [{"z": 1, "b": 2}]},
+    }
+    result = MetadataParserV1().parse(raw)
+
+    assert list(result["status"]["distributions"]["contrib"].keys()) == ["alias", "since"]
+    assert list(result["attributes"]["a"][0].keys()) == ["b", "z"]
+
+
 def test_parser_v1_sorts_dict_keys_inside_list_elements_without_reordering_the_list():
     """`entities` and `feature_gates` are lists of dicts with no dedicated
     normalizer. Recursive sorting must key-sort each dict *inside* the list
@@ -958,3 +963,22 @@ def test_metadata_parser_unknown_schema_version_in_file_raises(temp_component_di
     parser = MetadataParser(temp_component_dir)
     with pytest.raises(ValueError, match="Unsupported schema_version"):
         parser.parse()
+
+
+def test_metadata_parser_reuses_parse_of_identical_content(tmp_path):
+    """The same metadata.yaml content at different paths (e.g. per-version worktrees) is parsed once."""
+    content = "type: memoized\nstatus:\n  class: receiver\n"
+    first_dir, second_dir = tmp_path / "v1" / "otlpreceiver", tmp_path / "v2" / "otlpreceiver"
+    for component_dir in (first_dir, second_dir):
+        component_dir.mkdir(parents=True)
+        create_metadata_file(component_dir, content)
+
+    with patch(
+        "collector_watcher.metadata_parser.parse_component_metadata", wraps=parse_component_metadata
+    ) as parse_raw:
+        first = MetadataParser(first_dir).parse()
+        first["type"] = "mutated"
+        second = MetadataParser(second_dir).parse()
+
+    assert parse_raw.call_count == 1
+    assert second["type"] == "memoized"
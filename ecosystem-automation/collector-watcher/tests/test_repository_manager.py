@@ -14,11 +14,9 @@
 #
 """Tests for repository manager."""
 
-import shutil
 import subprocess
-import tempfile
+import threading
 from pathlib import Path
-from subprocess import CalledProcessError
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -29,35 +27,24 @@ from collector_watcher.repository_manager import (
 )
 from semantic_version import Version
 from watcher_common.repository_manager import _GIT
-from watcher_common.testing import git_commit, init_repo, run_git
+from watcher_common.testing import git_commit, import_tagged_history, init_repo, run_git
+from watcher_common.version_detector import VersionDetector
 
 
-@pytest.fixture
-def temp_dir():
-    temp_path = tempfile.mkdtemp()
-    yield Path(temp_path)
-    shutil.rmtree(temp_path)
-
-
-@pytest.fixture
-def mock_repo():
-    """Create a mock git repository."""
-    temp_path = tempfile.mkdtemp()
-    repo_path = Path(temp_path)
+@pytest.fixture(scope="module")
+def mock_repo(tmp_path_factory):
+    """Create a mock git repository, built once and shared by the tests that only read it."""
+    repo_path = tmp_path_factory.mktemp("mock_repo")
 
     init_repo(repo_path)
 
     (repo_path / "README.md").write_text("Test repo")
     run_git(repo_path, "add", ".")
     git_commit(repo_path, "Initial commit")
+    # -B names the branch main whatever init.defaultBranch is
+    run_git(repo_path, "checkout", "-B", "main")
 
-    try:
-        run_git(repo_path, "checkout", "-b", "main")
-    except CalledProcessError:
-        run_git(repo_path, "checkout", "main")
-
-    yield repo_path
-    shutil.rmtree(temp_path, ignore_errors=True)
+    return repo_path
 
 
 class TestRepositoryManager:
@@ -65,9 +52,9 @@ class TestRepositoryManager:
         manager = RepositoryManager()
         assert manager.base_dir == Path("tmp_repos")
 
-    def test_init_custom_base_dir(self, temp_dir):
-        manager = RepositoryManager(str(temp_dir))
-        assert manager.base_dir == temp_dir
+    def test_init_custom_base_dir(self, tmp_path):
+        manager = RepositoryManager(str(tmp_path))
+        assert manager.base_dir == tmp_path
 
     def test_get_repository_path_from_env_var(self, mock_repo, monkeypatch):
         monkeypatch.setenv(ENV_VAR_NAMES["core"], str(mock_repo))
@@ -94,9 +81,9 @@ class TestRepositoryManager:
         assert path is None
 
     @patch("watcher_common.repository_manager.subprocess.run")
-    def test_clone_repository(self, mock_run, temp_dir):
-        manager = RepositoryManager(str(temp_dir))
-        target_path = temp_dir / "opentelemetry-collector-core"
+    def test_clone_repository(self, mock_run, tmp_path):
+        manager = RepositoryManager(str(tmp_path))
+        target_path = tmp_path / "opentelemetry-collector-core"
 
         mock_run.return_value = MagicMock(returncode=0)
 
@@ -110,9 +97,9 @@ class TestRepositoryManager:
         )
 
     @patch("watcher_common.repository_manager.subprocess.run")
-    def test_clone_repository_failure_raises_runtime_error(self, mock_run, temp_dir):
-        manager = RepositoryManager(str(temp_dir))
-        target_path = temp_dir / "opentelemetry-collector-core"
+    def test_clone_repository_failure_raises_runtime_error(self, mock_run, tmp_path):
+        manager = RepositoryManager(str(tmp_path))
+        target_path = tmp_path / "opentelemetry-collector-core"
 
         mock_run.side_effect = subprocess.CalledProcessError(1, "git clone", stderr="Clone failed")
 
@@ -120,44 +107,63 @@ class TestRepositoryManager:
             manager._clone_repository(REPO_URLS["core"], target_path)
 
     @patch("watcher_common.repository_manager.subprocess.run")
-    def test_pull_latest(self, mock_run, temp_dir):
-        manager = RepositoryManager(str(temp_dir))
+    def test_pull_latest(self, mock_run, tmp_path):
+        manager = RepositoryManager(str(tmp_path))
         mock_run.return_value = MagicMock(returncode=0)
 
-        manager._pull_latest(temp_dir)
+        manager._pull_latest(tmp_path)
 
-        assert mock_run.call_count == 2
-        assert mock_run.call_args_list[0][0][0] == [_GIT, "checkout", "main"]
-        assert mock_run.call_args_list[1][0][0] == [_GIT, "pull"]
+        assert [c[0][0] for c in mock_run.call_args_list] == [
+            [_GIT, "symbolic-ref", "--quiet", "--short", "HEAD"],
+            [_GIT, "checkout", "main"],
+            [_GIT, "pull"],
+        ]
+
+    @patch("watcher_common.repository_manager.subprocess.run")
+    def test_pull_latest_on_main_skips_checkout(self, mock_run, tmp_path):
+        manager = RepositoryManager(str(tmp_path))
+        mock_run.return_value = MagicMock(returncode=0, stdout="main\n")
+
+        manager._pull_latest(tmp_path)
+
+        assert [c[0][0][1] for c in mock_run.call_args_list] == ["symbolic-ref", "pull"]
 
     @patch("watcher_common.repository_manager.subprocess.run")
-    def test_pull_latest_failure_raises_runtime_error(self, mock_run, temp_dir):
-        manager = RepositoryManager(str(temp_dir))
+    def test_pull_latest_failure_raises_runtime_error(self, mock_run, tmp_path):
+        manager = RepositoryManager(str(tmp_path))
         mock_run.side_effect = subprocess.CalledProcessError(1, "git pull", stderr="Pull failed")
 
         with pytest.raises(RuntimeError, match="Failed to pull"):
-            manager._pull_latest(temp_dir)
+            manager._pull_latest(tmp_path)
 
     @patch("watcher_common.repository_manager.subprocess.run")
-    def test_checkout_specified_version(self, mock_run, temp_dir):
-        manager = RepositoryManager(str(temp_dir))
+    def test_checkout_specified_version(self, mock_run, tmp_path):
+        manager = RepositoryManager(str(tmp_path))
         version = Version("1.0.0")
         mock_run.return_value = MagicMock(returncode=0)
 
-        manager._checkout_version(temp_dir, version)
+        manager._checkout_version(tmp_path, version)
 
-        assert mock_run.call_count == 2
-        assert mock_run.call_args_list[0][0][0] == [_GIT, "fetch", "--tags"]
-        assert mock_run.call_args_list[1][0][0] == [_GIT, "checkout", "v1.0.0"]
+        # The tag is already present locally, so nothing is fetched
+        assert [c[0][0] for c in mock_run.call_args_list] == [[_GIT, "checkout", "v1.0.0"]]
 
     @patch("watcher_common.repository_manager.subprocess.run")
-    def test_checkout_version_failure_raises_runtime_error(self, mock_run, temp_dir):
-        manager = RepositoryManager(str(temp_dir))
+    def test_checkout_version_fetches_missing_tag(self, mock_run, tmp_path):
+        manager = RepositoryManager(str(tmp_path))
+        mock_run.side_effect = [subprocess.CalledProcessError(1, "git checkout"), MagicMock(), MagicMock()]
+
+        manager._checkout_version(tmp_path, Version("1.0.0"))
+
+        assert [c[0][0][1] for c in mock_run.call_args_list] == ["checkout", "fetch", "checkout"]
+
+    @patch("watcher_common.repository_manager.subprocess.run")
+    def test_checkout_version_failure_raises_runtime_error(self, mock_run, tmp_path):
+        manager = RepositoryManager(str(tmp_path))
         version = Version("1.0.0")
         mock_run.side_effect = subprocess.CalledProcessError(1, "git checkout", stderr="Checkout failed")
 
         with pytest.raises(RuntimeError, match="Failed to checkout"):
-            manager._checkout_version(temp_dir, version)
+            manager._checkout_version(tmp_path, version)
 
     def test_setup_repository_with_env_var_when_present(self, mock_repo, monkeypatch):
         monkeypatch.setenv(ENV_VAR_NAMES["core"], str(mock_repo))
@@ -177,27 +183,32 @@ class TestRepositoryManager:
         path = manager.setup_repository("core", version=version, update=False)
 
         assert path == mock_repo
-        # Should have called git fetch and git checkout
-        assert mock_run.call_count == 2
+        # The tag is checked out directly; no lookup or fetch is needed
+        assert mock_run.call_count == 1
 
     @patch("watcher_common.repository_manager.subprocess.run")
-    def test_setup_repository_clones_when_not_exists(self, mock_run, temp_dir):
-        manager = RepositoryManager(str(temp_dir))
+    def test_setup_repository_clones_when_not_exists(self, mock_run, tmp_path):
+        manager = RepositoryManager(str(tmp_path))
         mock_run.return_value = MagicMock(returncode=0)
 
         path = manager.setup_repository("core", update=False)
 
-        expected_path = temp_dir / "opentelemetry-collector-core"
+        expected_path = tmp_path / "opentelemetry-collector-core"
         assert path == expected_path
-        # Should have called git clone
+        # The collector repositories are cloned blobless
         mock_run.assert_called_once()
-        assert mock_run.call_args[0][0][0] == _GIT
-        assert mock_run.call_args[0][0][1] == "clone"
+        assert mock_run.call_args[0][0] == [
+            _GIT,
+            "clone",
+            "--filter=blob:none",
+            REPO_URLS["core"],
+            str(expected_path),
+        ]
 
     @patch("watcher_common.repository_manager.subprocess.run")
-    def test_setup_repository_pulls_when_exists(self, mock_run, temp_dir):
-        manager = RepositoryManager(str(temp_dir))
-        repo_path = temp_dir / "opentelemetry-collector-core"
+    def test_setup_repository_pulls_when_exists(self, mock_run, tmp_path):
+        manager = RepositoryManager(str(tmp_path))
+        repo_path = tmp_path / "opentelemetry-collector-core"
         repo_path.mkdir(parents=True)
         (repo_path / ".git").mkdir()
 
@@ -206,14 +217,14 @@ class TestRepositoryManager:
         path = manager.setup_repository("core", update=True)
 
         assert path == repo_path
-        # Should have called git checkout and git pull
-        assert mock_run.call_count == 2
+        # Should have checked the current branch, then called git checkout and git pull
+        assert mock_run.call_count == 3
 
     @patch("watcher_common.repository_manager.subprocess.run")
-    def test_setup_repository_no_update_when_exists(self, mock_run, temp_dir):
+    def test_setup_repository_no_update_when_exists(self, mock_run, tmp_path):
         """Test setup skips pull when update=False."""
-        manager = RepositoryManager(str(temp_dir))
-        repo_path = temp_dir / "opentelemetry-collector-core"
+        manager = RepositoryManager(str(tmp_path))
+        repo_path = tmp_path / "opentelemetry-collector-core"
         repo_path.mkdir(parents=True)
         (repo_path / ".git").mkdir()
 
@@ -224,35 +235,72 @@ class TestRepositoryManager:
         mock_run.assert_not_called()
 
     @patch("watcher_common.repository_manager.subprocess.run")
-    def test_setup_repository_with_version(self, mock_run, temp_dir):
-        manager = RepositoryManager(str(temp_dir))
+    def test_setup_repository_with_version(self, mock_run, tmp_path):
+        manager = RepositoryManager(str(tmp_path))
         version = Version("1.2.3")
         mock_run.return_value = MagicMock(returncode=0)
 
         path = manager.setup_repository("core", version=version)
 
-        expected_path = temp_dir / "opentelemetry-collector-core"
+        expected_path = tmp_path / "opentelemetry-collector-core"
         assert path == expected_path
-        # Should have called git clone, fetch, and checkout
-        assert mock_run.call_count == 3
+        # A fresh clone starts at the tag: no separate fetch or checkout, only the local main branch
+        assert [c[0][0] for c in mock_run.call_args_list] == [
+            [_GIT, "clone", "--filter=blob:none", "--branch", "v1.2.3", REPO_URLS["core"], str(expected_path)],
+            [_GIT, "branch", "--track", "main", "origin/main"],
+        ]
+
+    def test_setup_repository_with_version_keeps_main_resolvable(self, tmp_path, monkeypatch):
+        upstream = tmp_path / "upstream"
+        upstream.mkdir()
+        init_repo(upstream)
+        import_tagged_history(upstream, [("v1.0.0", "one", "Release 1.0.0"), ("v1.1.0", "two", "Release 1.1.0")])
+        monkeypatch.setitem(REPO_URLS, "core", upstream.as_uri())
+        monkeypatch.delenv(ENV_VAR_NAMES["core"], raising=False)
+
+        path = RepositoryManager(str(tmp_path / "repos")).setup_repository("core", version=Version("1.0.0"))
+
+        detector = VersionDetector(path)
+        try:
+            assert run_git(path, "rev-parse", "HEAD") == run_git(upstream, "rev-parse", "v1.0.0")
+            assert detector.get_main_head_sha() is not None
+            assert detector.get_main_head_sha() == run_git(upstream, "rev-parse", "main")
+            assert detector.read_file_at_ref("main", "test.txt") == "two"
+        finally:
+            detector.close()
+
+    @patch("watcher_common.repository_manager.subprocess.run")
+    def test_setup_existing_repository_with_version_fetches_tags(self, mock_run, tmp_path):
+        manager = RepositoryManager(str(tmp_path))
+        (tmp_path / "opentelemetry-collector-core").mkdir()
+        # The existing clone doesn't have the tag yet
+        mock_run.side_effect = [subprocess.CalledProcessError(1, "git checkout"), MagicMock(), MagicMock()]
+
+        manager.setup_repository("core", version=Version("1.2.3"))
+
+        assert [c[0][0] for c in mock_run.call_args_list] == [
+            [_GIT, "checkout", "v1.2.3"],
+            [_GIT, "fetch", "--tags"],
+            [_GIT, "checkout", "v1.2.3"],
+        ]
 
     @patch("watcher_common.repository_manager.subprocess.run")
-    def test_setup_all_repositories(self, mock_run, temp_dir):
-        manager = RepositoryManager(str(temp_dir))
+    def test_setup_all_repositories(self, mock_run, tmp_path):
+        manager = RepositoryManager(str(tmp_path))
         mock_run.return_value = MagicMock(returncode=0)
 
         paths = manager.setup_all_repositories(update=False)
 
         assert "core" in paths
         assert "contrib" in paths
-        assert paths["core"] == temp_dir / "opentelemetry-collector-core"
-        assert paths["contrib"] == temp_dir / "opentelemetry-collector-contrib"
+        assert paths["core"] == tmp_path / "opentelemetry-collector-core"
+        assert paths["contrib"] == tmp_path / "opentelemetry-collector-contrib"
         # Should have cloned both repos
         assert mock_run.call_count == 2
 
     @patch("watcher_common.repository_manager.subprocess.run")
-    def test_setup_all_repositories_with_version(self, mock_run, temp_dir):
-        manager = RepositoryManager(str(temp_dir))
+    def test_setup_all_repositories_with_version(self, mock_run, tmp_path):
+        manager = RepositoryManager(str(tmp_path))
         version = Version("1.0.0")
         mock_run.return_value = MagicMock(returncode=0)
 
@@ -260,13 +308,28 @@ class TestRepositoryManager:
 
         assert "core" in paths
         assert "contrib" in paths
-        # Should have cloned both repos and checked out versions
-        # 2 clones + 2 * (fetch + checkout) = 6 calls
-        assert mock_run.call_count == 6
+        # Fresh clones start at the tag, so each repo needs only its clone and local main branch
+        assert sorted(c[0][0][1] for c in mock_run.call_args_list) == ["branch", "branch", "clone", "clone"]
+        clones = [c[0][0] for c in mock_run.call_args_list if c[0][0][1] == "clone"]
+        assert all(args[3:5] == ["--branch", "v1.0.0"] for args in clones)
+
+    def test_setup_all_repositories_sets_up_distributions_concurrently(self, tmp_path):
+        manager = RepositoryManager(str(tmp_path))
+        # Each setup waits for the other to start; a sequential setup would time out here.
+        both_started = threading.Barrier(2, timeout=5)
+
+        def setup(distribution, version=None, update=True):
+            both_started.wait()
+            return tmp_path / distribution
+
+        with patch.object(manager, "setup_repository", side_effect=setup):
+            paths = manager.setup_all_repositories()
+
+        assert paths == {"core": tmp_path / "core", "contrib": tmp_path / "contrib"}
 
-    def test_setup_repository_creates_base_dir(self, temp_dir):
+    def test_setup_repository_creates_base_dir(self, tmp_path):
         """Test that setup creates base directory if it doesn't exist."""
-        base_dir = temp_dir / "nested" / "repos"
+        base_dir = tmp_path / "nested" / "repos"
         manager = RepositoryManager(str(base_dir))
 
         with patch("watcher_common.repository_manager.subprocess.run") as mock_run:
@@ -14,8 +14,11 @@
 #
 """Tests for version detector."""
 
+import shutil
+import subprocess
 from pathlib import Path
 from subprocess import CalledProcessError
+from unittest.mock import patch
 
 import pytest
 from semantic_version import Version
@@ -138,6 +141,30 @@ class TestVersionDetector:
         assert len(tags) == 3
         assert all(not tag.prerelease for tag in tags)
 
+    def test_get_all_release_tags_skips_module_tags_without_parsing(self, temp_git_repo):
+        run_git(temp_git_repo, "tag", "pdata/v1.0.0")
+        detector = VersionDetector(temp_git_repo)
+
+        with patch("watcher_common.version_detector.Version", wraps=Version) as parse_version:
+            tags = detector.get_all_release_tags()
+
+        assert tags == [Version("0.112.0"), Version("0.111.0"), Version("0.110.0")]
+        assert all("/" not in call.args[0] for call in parse_version.call_args_list)
+
+    def test_release_tags_are_listed_once_until_invalidated(self, temp_git_repo):
+        detector = VersionDetector(temp_git_repo)
+
+        with patch.object(detector, "_list_tags", wraps=detector._list_tags) as list_tags:
+            assert detector.get_latest_release_tag() == Version("0.112.0")
+            assert detector.get_all_release_tags()[0] == Version("0.112.0")
+            assert list_tags.call_count == 1
+
+            run_git(temp_git_repo, "tag", "v0.114.0")
+            detector.invalidate_release_tags()
+
+            assert detector.get_latest_release_tag() == Version("0.114.0")
+            assert list_tags.call_count == 2
+
     def test_checkout_version(self, temp_git_repo):
         detector = VersionDetector(temp_git_repo)
         version = Version("0.111.0")
@@ -168,6 +195,46 @@ class TestVersionDetector:
         current_branch = run_git(temp_git_repo, "branch", "--show-current")
         assert current_branch == "main"
 
+    def test_worktree_checks_out_independently(self, temp_git_repo, tmp_path):
+        detector = VersionDetector(temp_git_repo)
+        worktree = tmp_path / "wt"
+
+        detector.add_worktree(worktree)
+        VersionDetector(worktree).checkout_version(Version("0.110.0"))
+
+        assert (worktree / "test.txt").read_text() == "initial content"
+        # The main clone stays on main.
+        assert run_git(temp_git_repo, "branch", "--show-current") == "main"
+        assert (temp_git_repo / "test.txt").read_text() == "update 3"
+
+        detector.remove_worktree(worktree)
+
+        assert not worktree.exists()
+        assert len(run_git(temp_git_repo, "worktree", "list").splitlines()) == 1
+
+    def test_checkout_main_detached_in_worktree(self, temp_git_repo, tmp_path):
+        """main is checked out in the clone, so a worktree can only detach onto it."""
+        detector = VersionDetector(temp_git_repo)
+        worktree = tmp_path / "wt"
+        detector.add_worktree(worktree)
+        worktree_detector = VersionDetector(worktree)
+        worktree_detector.checkout_version(Version("0.110.0"))
+
+        worktree_detector.checkout_main(detach=True)
+
+        assert run_git(worktree, "rev-parse", "HEAD") == run_git(temp_git_repo, "rev-parse", "main")
+        detector.remove_worktree(worktree)
+
+    def test_remove_missing_worktree_is_pruned(self, temp_git_repo, tmp_path):
+        detector = VersionDetector(temp_git_repo)
+        worktree = tmp_path / "wt"
+        detector.add_worktree(worktree)
+        shutil.rmtree(worktree)
+
+        detector.remove_worktree(worktree)
+
+        assert len(run_git(temp_git_repo, "worktree", "list").splitlines()) == 1
+
     def test_read_file_at_ref_returns_content_at_tag(self, temp_git_repo):
         detector = VersionDetector(temp_git_repo)
 
@@ -196,6 +263,67 @@ class TestVersionDetector:
         detector = VersionDetector(temp_git_repo)
         assert detector.read_file_at_ref("v9.9.9", "test.txt") is None
 
+    def test_read_file_at_ref_reuses_one_git_process(self, temp_git_repo):
+        detector = VersionDetector(temp_git_repo)
+        with patch("watcher_common.version_detector.subprocess.Popen", wraps=subprocess.Popen) as mock_popen:
+            for tag in ("v0.110.0", "v0.111.0", "v0.112.0", "v9.9.9"):
+                detector.read_file_at_ref(tag, "test.txt")
+            detector.close()
+            assert detector.read_file_at_ref("v0.111.0", "test.txt") == "update 1"
+            detector.close()
+
+        # One process for the first four reads, a fresh one after close().
+        assert mock_popen.call_count == 2
+
+    def test_read_file_at_ref_follows_moving_branch(self, temp_git_repo):
+        detector = VersionDetector(temp_git_repo)
+        assert detector.read_file_at_ref("main", "test.txt") == "update 3"
+
+        (temp_git_repo / "test.txt").write_text("update 4")
+        run_git(temp_git_repo, "add", "test.txt")
+        git_commit(temp_git_repo, "Update 4")
+
+        assert detector.read_file_at_ref("main", "test.txt") == "update 4"
+        detector.close()
+
+    def test_read_file_at_ref_directory_returns_none(self, temp_git_repo):
+        (temp_git_repo / "sub").mkdir()
+        (temp_git_repo / "sub" / "file.txt").write_text("nested")
+        run_git(temp_git_repo, "add", "sub")
+        git_commit(temp_git_repo, "Add subdirectory")
+
+        detector = VersionDetector(temp_git_repo)
+        assert detector.read_file_at_ref("main", "sub") is None
+        assert detector.read_file_at_ref("main", "sub/file.txt") == "nested"
+        detector.close()
+
+    def test_get_main_head_sha(self, temp_git_repo):
+        detector = VersionDetector(temp_git_repo)
+        run_git(temp_git_repo, "checkout", "v0.110.0")
+
+        assert detector.get_main_head_sha() == run_git(temp_git_repo, "rev-parse", "main")
+
+    def test_get_main_head_sha_shares_the_read_process(self, temp_git_repo):
+        detector = VersionDetector(temp_git_repo)
+        with (
+            patch("watcher_common.version_detector.subprocess.Popen", wraps=subprocess.Popen) as mock_popen,
+            patch("watcher_common.version_detector.subprocess.run") as mock_run,
+        ):
+            detector.read_file_at_ref("main", "test.txt")
+            sha = detector.get_main_head_sha()
+            detector.close()
+
+        assert sha == run_git(temp_git_repo, "rev-parse", "main")
+        assert mock_popen.call_count == 1
+        mock_run.assert_not_called()
+
+    def test_get_main_head_sha_without_main_returns_none(self, temp_git_repo):
+        detector = VersionDetector(temp_git_repo)
+        run_git(temp_git_repo, "checkout", "--detach", "main")
+        run_git(temp_git_repo, "branch", "-D", "main")
+
+        assert detector.get_main_head_sha() is None
+
     def test_determine_next_snapshot_version(self, temp_git_repo):
         detector = VersionDetector(temp_git_repo)
         next_version = detector.determine_next_snapshot_version()
@@ -206,6 +334,10 @@ class TestVersionDetector:
         assert next_version.patch == 1
         assert next_version.prerelease
 
+    def test_next_snapshot_after(self):
+        assert VersionDetector.next_snapshot_after(Version("0.112.0")) == Version("0.112.1-SNAPSHOT")
+        assert VersionDetector.next_snapshot_after(None) == Version("0.0.1-SNAPSHOT")
+
     def test_determine_next_snapshot_version_empty_repo(self, empty_git_repo):
         """Test determining next snapshot version with no existing releases."""
         detector = VersionDetector(empty_git_repo)
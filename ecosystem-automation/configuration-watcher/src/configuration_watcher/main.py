@@ -18,12 +18,6 @@ import argparse
 import logging
 import sys
 
-from semantic_version import Version
-
-from configuration_watcher.configuration_sync import ConfigurationSync
-from configuration_watcher.inventory_manager import InventoryManager
-from configuration_watcher.repository_manager import RepositoryManager
-
 logger = logging.getLogger(__name__)
 
 
@@ -61,6 +55,14 @@ def main():
     )
     args = parser.parse_args()
 
+    # Deferred until argparse has accepted the command line, so --help and usage errors
+    # return without loading semantic_version, YAML and the git helpers.
+    from semantic_version import Version
+
+    from configuration_watcher.configuration_sync import ConfigurationSync
+    from configuration_watcher.inventory_manager import InventoryManager
+    from configuration_watcher.repository_manager import RepositoryManager
+
     logger.info("Configuration Watcher")
     logger.info("Inventory directory: %s", args.inventory_dir)
 
@@ -65,6 +65,8 @@ class TestRepositoryManager:
         args = mock_run.call_args[0][0]
         assert args[0] == _GIT
         assert args[1] == "clone"
+        # Partial clones are opt-in; this repository is cloned in full
+        assert "--filter=blob:none" not in args
 
     def test_setup_repository_uses_env_var(self, manager, tmp_path):
         repo_path = tmp_path / "env-repo"
@@ -27,7 +27,7 @@ STABILITY_PRIORITY = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentSyncData:
     """Fields extracted from V2 that are candidates for syncing into a V1 entry."""
 
@@ -49,7 +49,7 @@ class ComponentSyncData:
         return changes
 
 
-@dataclass
+@dataclass(slots=True)
 class V1SyncReport:
     """Report of proposed V1 changes derived from a single V2 registry snapshot."""
 
@@ -28,6 +28,9 @@ from .content_hashing import compute_content_hash
 
 logger = logging.getLogger(__name__)
 
+# README files are stored as {name}-{12-hex-char hash}.md
+_README_FILENAME_RE = re.compile(r"^(.+)-([a-f0-9]{12})\.md$")
+
 
 class BaseInventoryManager:
     """Base class for versioned inventory storage.
@@ -332,7 +335,7 @@ class JavaagentInventoryManager(BaseInventoryManager):
         Parse a README filename into (library_name, markdown_hash).
         Format: {library-name}-{hash}.md
         """
-        match = re.match(r"^(.+)-([a-f0-9]{12})\.md$", filename)
+        match = _README_FILENAME_RE.match(filename)
         if match:
             return match.group(1), match.group(2)
         return None
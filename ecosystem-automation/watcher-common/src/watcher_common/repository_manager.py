@@ -74,22 +74,36 @@ class BaseRepositoryManager:
 
         return None
 
-    def _clone_repository(self, url: str, target_path: Path) -> None:
+    def _clone_repository(
+        self,
+        url: str,
+        target_path: Path,
+        branch: str | None = None,
+        blobless: bool = False,
+    ) -> None:
         """
         Clone a repository from the given URL.
 
         Args:
             url: Git remote URL to clone from
             target_path: Where to clone the repository
+            branch: Optional branch or tag to check out instead of the remote's
+                default branch. All refs are still fetched.
+            blobless: Make a partial clone (``--filter=blob:none``). The full
+                history and every tag are still fetched, so any version can be
+                checked out or read, but file contents are only downloaded for
+                the trees that are actually checked out.
 
         Raises:
             RuntimeError: If cloning fails
         """
         target_path.parent.mkdir(parents=True, exist_ok=True)
+        filter_args = ["--filter=blob:none"] if blobless else []
+        branch_args = ["--branch", branch] if branch else []
 
         try:
             subprocess.run(
-                [_GIT, "clone", url, str(target_path)],
+                [_GIT, "clone", *filter_args, *branch_args, url, str(target_path)],
                 check=True,
                 capture_output=True,
                 text=True,
@@ -98,6 +112,31 @@ class BaseRepositoryManager:
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to clone repository from {url}: {e.stderr}") from e
 
+    def _create_local_branch(self, repo_path: Path, branch: str = "main") -> None:
+        """
+        Create a local branch tracking its ``origin`` counterpart.
+
+        A clone made with ``--branch <tag>`` starts on a detached HEAD and has no
+        local branches, so refs such as ``main`` would not resolve without this.
+
+        Args:
+            repo_path: Path to the repository
+            branch: Branch name to create from ``origin/<branch>``
+
+        Raises:
+            RuntimeError: If the branch cannot be created
+        """
+        try:
+            subprocess.run(
+                [_GIT, "branch", "--track", branch, f"origin/{branch}"],
+                cwd=repo_path,
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Failed to create local branch {branch}: {e.stderr}") from e
+
     def _pull_latest(self, repo_path: Path) -> None:
         """
         Pull latest changes from remote.
@@ -109,13 +148,22 @@ class BaseRepositoryManager:
             RuntimeError: If pull fails
         """
         try:
-            subprocess.run(
-                [_GIT, "checkout", "main"],
+            # Usually already on main (e.g. a clone that was only ever pulled); skip the checkout then
+            head = subprocess.run(
+                [_GIT, "symbolic-ref", "--quiet", "--short", "HEAD"],
                 cwd=repo_path,
-                check=True,
+                check=False,
                 capture_output=True,
                 text=True,
             )
+            if head.returncode != 0 or head.stdout.strip() != "main":
+                subprocess.run(
+                    [_GIT, "checkout", "main"],
+                    cwd=repo_path,
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                )
             subprocess.run(
                 [_GIT, "pull"],
                 cwd=repo_path,
@@ -141,20 +189,31 @@ class BaseRepositoryManager:
         # Git tags have 'v' prefix (e.g., "v0.112.0")
         tag = f"v{version}"
         try:
-            subprocess.run(
-                [_GIT, "fetch", "--tags"],
-                cwd=repo_path,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            subprocess.run(
-                [_GIT, "checkout", tag],
-                cwd=repo_path,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+            try:
+                subprocess.run(
+                    [_GIT, "checkout", tag],
+                    cwd=repo_path,
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                )
+            except subprocess.CalledProcessError:
+                # Release tags never move, so only a tag missing locally needs the network
+                # round-trip; trying the checkout first saves spawning a separate tag lookup.
+                subprocess.run(
+                    [_GIT, "fetch", "--tags"],
+                    cwd=repo_path,
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                )
+                subprocess.run(
+                    [_GIT, "checkout", tag],
+                    cwd=repo_path,
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                )
             logger.info("Successfully checked out %s at %s", tag, repo_path)
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to checkout version {tag}: {e.stderr}") from e
@@ -51,3 +51,29 @@ def init_repo(path: Path) -> None:
 def git_commit(path: Path, message: str) -> None:
     """Create a commit with *message* in *path*."""
     run_git(path, "commit", "--no-verify", "--no-gpg-sign", "-m", message)
+
+
+def import_tagged_history(path: Path, releases: list[tuple[str, str, str]]) -> None:
+    """Create a linear ``main`` history in *path* with a lightweight tag on each commit.
+
+    ``releases`` is a list of (tag, test.txt content, commit message). The whole
+    history goes through one ``git fast-import`` call instead of an add, commit
+    and tag per commit; ``main`` is checked out afterwards.
+    """
+    lines: list[str] = []
+    for mark, (tag, content, message) in enumerate(releases, start=1):
+        lines += [
+            "commit refs/heads/main",
+            f"mark :{mark}",
+            "committer Test User <test@example.com> 1700000000 +0000",
+            f"data {len(message.encode())}",
+            message,
+            "M 100644 inline test.txt",
+            f"data {len(content.encode())}",
+            content,
+            f"reset refs/tags/{tag}",
+            f"from :{mark}",
+            "",
+        ]
+    subprocess.run([_GIT, "fast-import", "--quiet"], cwd=path, input="\n".join(lines), check=True, text=True)
+    run_git(path, "checkout", "-f", "main")
@@ -15,6 +15,8 @@
 """Version detection for OpenTelemetry git repositories."""
 
 import subprocess
+import threading
+import weakref
 from pathlib import Path
 
 from semantic_version import Version
@@ -22,6 +24,92 @@ from semantic_version import Version
 from watcher_common.repository_manager import _GIT
 
 
+def _stop_process(proc: subprocess.Popen) -> None:
+    """Close a ``git cat-file --batch`` process's stdin (ending its loop) and reap it."""
+    if proc.stdin:
+        proc.stdin.close()
+    try:
+        proc.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+    if proc.stdout:
+        proc.stdout.close()
+
+
+class _CatFileBatch:
+    """A long-lived ``git cat-file --batch`` process serving object reads over stdin/stdout.
+
+    Started on first use and shared by every read, so a run that reads many
+    ``ref:path`` objects pays for one git process instead of one per read.
+    Object names are resolved on each request, so moving refs (e.g. ``main``)
+    are always read at their current commit.
+    """
+
+    def __init__(self, repo_path: Path):
+        self._repo_path = repo_path
+        self._proc: subprocess.Popen | None = None
+        self._finalizer: weakref.finalize | None = None
+        self._lock = threading.Lock()
+
+    def read(self, object_name: str) -> bytes | None:
+        """Return the content of blob ``object_name``, or None if it is missing or not a blob."""
+        found = self._request(object_name)
+        if found is None or found[1] != b"blob":
+            return None
+        return found[2]
+
+    def resolve(self, object_name: str) -> str | None:
+        """Return the full SHA that ``object_name`` resolves to, or None if it is missing."""
+        found = self._request(object_name)
+        return found[0].decode("ascii") if found is not None else None
+
+    def _request(self, object_name: str) -> tuple[bytes, bytes, bytes] | None:
+        """Look up ``object_name``, returning its (sha, type, content), or None if it is missing."""
+        if "\n" in object_name:
+            return None
+        with self._lock:
+            proc = self._ensure_started()
+            proc.stdin.write(object_name.encode("utf-8") + b"\n")
+            proc.stdin.flush()
+            header = proc.stdout.readline()
+            if not header:
+                # The process exited; drop it so the next read starts a fresh one.
+                self._stop()
+                return None
+            # "<object> missing" / "<object> ambiguous", otherwise "<sha> <type> <size>".
+            if header.endswith((b" missing\n", b" ambiguous\n")):
+                return None
+            sha, object_type, size = header.split()
+            content = proc.stdout.read(int(size))
+            proc.stdout.read(1)  # trailing newline after the object content
+            return sha, object_type, content
+
+    def close(self) -> None:
+        """Stop the git process, if one is running."""
+        with self._lock:
+            self._stop()
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._proc is None:
+            self._proc = subprocess.Popen(
+                [_GIT, "cat-file", "--batch"],
+                cwd=self._repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            # Reap the process even if close() is never called.
+            self._finalizer = weakref.finalize(self, _stop_process, self._proc)
+        return self._proc
+
+    def _stop(self) -> None:
+        if self._finalizer is not None:
+            self._finalizer()
+        self._proc = None
+        self._finalizer = None
+
+
 class VersionDetector:
     """Detects versions in OpenTelemetry git repositories."""
 
@@ -35,11 +123,24 @@ class VersionDetector:
         self.repo_path = Path(repo_path)
         if not self.repo_path.exists():
             raise ValueError(f"Repository path does not exist: {repo_path}")
+        self._cat_file = _CatFileBatch(self.repo_path)
+        # Release versions parsed from the tag list on first use. Checkouts don't change the
+        # tags; call invalidate_release_tags() after fetching new ones.
+        self._release_versions: list[Version] | None = None
+
+    def close(self) -> None:
+        """Stop the long-lived git process used by ``read_file_at_ref``, if started."""
+        self._cat_file.close()
 
     def _list_tags(self) -> list[str]:
-        """Return all tag names in the repository."""
+        """Return the names of the repository's top-level tags.
+
+        Tags nested under a path, such as the Go module tags ("pdata/v1.0.0") that far
+        outnumber release tags in the collector repositories, can never be versions; the
+        ``refs/tags/*`` pattern leaves them out inside git rather than in Python.
+        """
         result = subprocess.run(
-            [_GIT, "tag", "--list"],
+            [_GIT, "for-each-ref", "--format=%(refname:lstrip=2)", "refs/tags/*"],
             cwd=self.repo_path,
             check=True,
             capture_output=True,
@@ -47,8 +148,18 @@ class VersionDetector:
         )
         return [line for line in result.stdout.splitlines() if line]
 
+    def invalidate_release_tags(self) -> None:
+        """Drop the cached release versions so the next lookup re-lists the tags."""
+        self._release_versions = None
+
     def _parse_release_versions(self) -> list[Version]:
-        """Parse all tag names into non-prerelease Version objects, ignoring invalid tags."""
+        """Parse all tag names into non-prerelease Version objects, newest first, ignoring invalid tags.
+
+        The result is cached on the instance and shared by every caller, which must not mutate it.
+        """
+        if self._release_versions is not None:
+            return self._release_versions
+
         versions = []
         for tag_name in self._list_tags():
             try:
@@ -58,6 +169,8 @@ class VersionDetector:
                     versions.append(version)
             except ValueError:
                 continue
+        versions.sort(reverse=True)
+        self._release_versions = versions
         return versions
 
     def get_latest_release_tag(self) -> Version | None:
@@ -67,7 +180,7 @@ class VersionDetector:
             Latest version tag, or None if no valid tags found
         """
         versions = self._parse_release_versions()
-        return max(versions) if versions else None
+        return versions[0] if versions else None
 
     def get_all_release_tags(self) -> list[Version]:
         """Get all release tags from the repository, sorted newest to oldest.
@@ -75,7 +188,7 @@ class VersionDetector:
         Returns:
             List of version tags
         """
-        return sorted(self._parse_release_versions(), reverse=True)
+        return list(self._parse_release_versions())
 
     def checkout_version(self, version: Version) -> None:
         """Checkout a specific version tag.
@@ -99,15 +212,21 @@ class VersionDetector:
         except subprocess.CalledProcessError as e:
             raise ValueError(f"Failed to checkout {tag_name}: {e.stderr}") from e
 
-    def checkout_main(self) -> None:
+    def checkout_main(self, detach: bool = False) -> None:
         """Checkout the main branch.
 
+        Args:
+            detach: Check out main's commit as a detached HEAD. Required in a
+                linked worktree, since git refuses to check out a branch that
+                is already checked out in another worktree.
+
         Raises:
             ValueError: If main doesn't exist
         """
+        args = [_GIT, "checkout", "--detach", "main"] if detach else [_GIT, "checkout", "main"]
         try:
             subprocess.run(
-                [_GIT, "checkout", "main"],
+                args,
                 cwd=self.repo_path,
                 check=True,
                 capture_output=True,
@@ -116,14 +235,64 @@ class VersionDetector:
         except subprocess.CalledProcessError as e:
             raise ValueError(f"Failed to checkout main branch: {e.stderr}") from e
 
+    def add_worktree(self, path: str | Path) -> None:
+        """Create a linked worktree at ``path`` with a detached HEAD.
+
+        Linked worktrees share the object store with this repository, so they
+        are cheap to create and let several versions be checked out at once.
+
+        Args:
+            path: Directory for the new worktree; must not already exist.
+
+        Raises:
+            ValueError: If the worktree cannot be created
+        """
+        try:
+            subprocess.run(
+                [_GIT, "worktree", "add", "--detach", str(path), "HEAD"],
+                cwd=self.repo_path,
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+        except subprocess.CalledProcessError as e:
+            raise ValueError(f"Failed to add worktree at {path}: {e.stderr}") from e
+
+    def remove_worktree(self, path: str | Path) -> None:
+        """Remove a linked worktree created by ``add_worktree``.
+
+        Best-effort: a worktree that is already gone is pruned from git's
+        bookkeeping instead of raising.
+
+        Args:
+            path: Directory of the worktree to remove.
+        """
+        result = subprocess.run(
+            [_GIT, "worktree", "remove", "--force", str(path)],
+            cwd=self.repo_path,
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            subprocess.run(
+                [_GIT, "worktree", "prune"],
+                cwd=self.repo_path,
+                check=False,
+                capture_output=True,
+                text=True,
+            )
+
     def read_file_at_ref(self, ref: str, rel_path: str) -> str | None:
         """Return the text content of ``rel_path`` at git ``ref``.
 
-        Reads the blob directly via ``git show`` without touching the working
-        tree, so the result depends only on ``ref`` — not on whatever revision
-        the repository is currently checked out to. This makes it safe to read a
-        file at one version while the clone is checked out to another (e.g.
-        resolving a per-version schema during a multi-version backfill).
+        Reads the blob directly from the object store without touching the
+        working tree, so the result depends only on ``ref`` — not on whatever
+        revision the repository is currently checked out to. This makes it safe
+        to read a file at one version while the clone is checked out to another
+        (e.g. resolving a per-version schema during a multi-version backfill).
+        Reads go through one long-lived ``git cat-file --batch`` process rather
+        than spawning git per call; see ``close``.
 
         Args:
             ref: Git ref to read from (tag like ``v0.145.0``, branch like
@@ -134,18 +303,20 @@ class VersionDetector:
             The file's text content, or None if ``ref`` does not exist or the
             file is absent at that ref.
         """
-        result = subprocess.run(
-            [_GIT, "show", f"{ref}:{rel_path}"],
-            cwd=self.repo_path,
-            check=False,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-        )
-        if result.returncode != 0:
+        content = self._cat_file.read(f"{ref}:{rel_path}")
+        if content is None:
             return None
-        return result.stdout
+        # Same text decoding `git show` output got before: UTF-8 with replacement, universal newlines.
+        return content.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+
+    def get_main_head_sha(self) -> str | None:
+        """Return the commit SHA that the local ``main`` branch points to.
+
+        Returns:
+            The full commit SHA, or None if ``main`` doesn't exist
+        """
+        # Resolved by the cat-file process that snapshot runs already use for reading files at main
+        return self._cat_file.resolve("main^{commit}")
 
     def determine_next_snapshot_version(self) -> Version:
         """Determine the next snapshot version based on latest release.
@@ -156,7 +327,18 @@ class VersionDetector:
         Returns:
             Next snapshot version
         """
-        latest = self.get_latest_release_tag()
+        return self.next_snapshot_after(self.get_latest_release_tag())
+
+    @staticmethod
+    def next_snapshot_after(latest: Version | None) -> Version:
+        """Return the snapshot version that follows release ``latest``.
+
+        Args:
+            latest: Latest release version, or None if there are no releases
+
+        Returns:
+            The next patch version with a SNAPSHOT prerelease tag
+        """
         if latest is None:
             return Version(major=0, minor=0, patch=1, prerelease=("SNAPSHOT",))
 